@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Throughput of the SQLite broker with 1, 4 and 16 local worker processes"""
+import asyncio
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.broker import SQLiteBroker
+from core.distributed import Worker
+from core.orchestrator import ParallelOrchestrator, Task
+
+TASKS = 400
+HANDLER_SECONDS = 0.05  # Simulated model-call latency per task
+
+
+class SleepingOrchestrator(ParallelOrchestrator):
+    """Handlers that wait like a remote model call instead of returning instantly"""
+
+    async def _execute_by_role(self, task: Task):
+        await asyncio.sleep(HANDLER_SECONDS)
+        return {"task": task.id}
+
+
+def serve(db_path: str) -> None:
+    worker = Worker(SQLiteBroker(db_path), factory=SleepingOrchestrator, idle_interval=0.01)
+    asyncio.run(worker.run(stop_when_idle=True))
+
+
+def measure(workers: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "broker.db")
+        broker = SQLiteBroker(db_path)
+        for i in range(TASKS):
+            broker.put(f"bench:{i}", Task(id=f"t{i}", role="backend_dev", action="bench").to_payload())
+
+        start = time.perf_counter()
+        processes = [multiprocessing.Process(target=serve, args=(db_path,)) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        assert broker.counts() == {"done": TASKS}, broker.counts()
+        broker.close()
+        return TASKS / elapsed
+
+
+def main():
+    print(f"{TASKS} tasks, {HANDLER_SECONDS * 1000:.0f}ms handler latency")
+    print(f"{'workers':>7} {'tasks/s':>9}")
+    for workers in (1, 4, 16):
+        print(f"{workers:>7} {measure(workers):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark wave scheduling overhead on large synthetic DAGs"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.orchestrator import ParallelOrchestrator, Task
+
+ROLES = ["product_owner", "backend_dev", "frontend_dev", "devops_eng", "qa_engineer", "tech_lead"]
+
+
+def layered_dag(size: int, width: int = 100, fan_in: int = 3, seed: int = 42):
+    """Random layered DAG: every task depends on up to `fan_in` tasks from earlier layers"""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(size):
+        layer_start = (i // width) * width
+        deps = []
+        if layer_start:
+            deps = [f"t{rng.randrange(layer_start)}" for _ in range(rng.randint(1, fan_in))]
+        tasks.append(Task(id=f"t{i}", role=ROLES[i % len(ROLES)], action="bench", dependencies=deps))
+    return tasks
+
+
+def legacy_calculate_waves(tasks):
+    """The previous rescanning implementation, kept for comparison"""
+    waves = []
+    completed_ids = set()
+    remaining_tasks = tasks.copy()
+    while remaining_tasks:
+        wave = [t for t in remaining_tasks if all(dep in completed_ids for dep in t.dependencies)]
+        if not wave:
+            raise ValueError("Circular dependency detected")
+        waves.append(wave)
+        completed_ids.update(t.id for t in wave)
+        remaining_tasks = [t for t in remaining_tasks if t not in wave]
+    return waves
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    orchestrator = ParallelOrchestrator()
+    print(f"{'nodes':>8} {'waves':>6} {'linear (s)':>11} {'legacy (s)':>11}")
+
+    for size in [1_000, 5_000, 10_000, 100_000]:
+        tasks = layered_dag(size)
+        waves, linear = timed(orchestrator.calculate_waves, tasks)
+        legacy = "-"
+        if size <= 5_000:
+            legacy_waves, seconds = timed(legacy_calculate_waves, tasks)
+            assert [[t.id for t in w] for w in legacy_waves] == [[t.id for t in w] for w in waves]
+            legacy = f"{seconds:.3f}"
+        print(f"{size:>8} {len(waves):>6} {linear:>11.3f} {legacy:>11}")
+
+
+if __name__ == "__main__":
+    main()
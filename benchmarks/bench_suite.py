@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Scheduler benchmark suite: wave computation, dispatch overhead and memory per DAG shape and size.
+
+    python benchmarks/bench_suite.py --save-baseline          # record a baseline on this machine
+    python benchmarks/bench_suite.py                          # full run, compare to the baseline
+    python benchmarks/bench_suite.py --sizes 10,1000 --json out.json
+
+Each timing is the median of several runs. Exits 1 when a metric regresses
+past the tolerance. Timings are machine dependent, so the baseline is kept
+untracked under .claude-squad/ and recorded on the machine that compares.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.backends import ModelResponse, RoleBackend
+from core.events import EventMetrics
+from core.executors import TaskExecutor
+from core.orchestrator import ParallelOrchestrator
+from dag_generators import SHAPES
+
+BASELINE = Path(__file__).parent.parent / ".claude-squad" / "bench-baseline.json"
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+class NullBackend(RoleBackend):
+    """Model call that returns immediately, leaving only orchestrator overhead"""
+
+    async def call(self, role: str, input_tokens: int, batch_size: int = 1) -> ModelResponse:
+        return ModelResponse(input_tokens, 0, 0.0)
+
+
+class NullExecutor(TaskExecutor):
+    async def run(self, orchestrator, task):
+        return None
+
+
+def timed(fn) -> float:
+    """Seconds for one call, with the cyclic GC paused as timeit does"""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def median_of(repeats: int, fn) -> float:
+    """Median of `repeats` timed calls; one slow or lucky run does not move it"""
+    return statistics.median(fn() for _ in range(repeats))
+
+
+def dispatch_seconds(tasks, dataflow: bool) -> float:
+    orchestrator = ParallelOrchestrator(dataflow=dataflow, backend=NullBackend(), metrics=EventMetrics())
+    orchestrator.set_executor(NullExecutor())
+    # Generated tasks share role, action and (null) upstream results; coalescing
+    # them would measure the single-flight shortcut instead of dispatch
+    orchestrator.singleflight = None
+    results: List[Any] = []
+    elapsed = timed(lambda: results.extend(asyncio.run(orchestrator.execute_wave(tasks))))
+    assert all(task.status.value == "completed" for task in results)
+    return elapsed
+
+
+def measure(shape: str, size: int, dispatch_max: int) -> Dict[str, Any]:
+    generate = SHAPES[shape]
+    orchestrator = ParallelOrchestrator()
+    repeats = 5 if size <= 10_000 else 3 if size <= 100_000 else 1
+
+    # Memory: graph construction plus wave computation
+    gc.collect()
+    tracemalloc.start()
+    tasks = generate(size)
+    built = tracemalloc.get_traced_memory()[0]
+    orchestrator.calculate_waves(tasks)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    tasks = generate(size)
+    waves = orchestrator.calculate_waves(tasks)
+    result = {
+        "waves": len(waves),
+        "build_s": median_of(repeats, lambda: timed(lambda: generate(size))),
+        "calculate_waves_s": median_of(repeats, lambda: timed(lambda: orchestrator.calculate_waves(tasks))),
+        "task_bytes": built / size,
+        "peak_bytes": peak / size,
+    }
+    if size <= dispatch_max:
+        for mode, dataflow in (("waves", False), ("dataflow", True)):
+            result[f"dispatch_{mode}_us"] = median_of(
+                repeats, lambda: dispatch_seconds(generate(size), dataflow)
+            ) / size * 1e6
+    return result
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            tolerance: float, floor: float = 0.1) -> List[str]:
+    """Metrics more than `tolerance` worse than the baseline.
+
+    Runs shorter than `floor` seconds in total are dominated by timer and
+    scheduling noise and are not compared.
+    """
+    regressions = []
+    for key, metrics in results.items():
+        size = int(key.rsplit(":", 1)[1])
+        for name, value in metrics.items():
+            before = baseline.get(key, {}).get(name)
+            if before is None or name == "waves":
+                continue
+            if name.endswith("_s") and max(value, before) < floor:
+                continue
+            if name.endswith("_us") and max(value, before) * size / 1e6 < floor:
+                continue
+            if value > before * (1 + tolerance):
+                regressions.append(f"{key} {name}: {before:.4g} -> {value:.4g} (+{value / before - 1:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument("--dispatch-max", type=int, default=10_000, help="Largest graph to execute end to end")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    parser.add_argument("--baseline", default=str(BASELINE), help="Local baseline file (not committed)")
+    parser.add_argument("--save-baseline", action="store_true")
+    # Shared and virtualised machines drift by 30-40% between runs of an unchanged tree
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown before flagging (0.5 = 50%%)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"{'shape':<9} {'nodes':>9} {'waves':>8} {'build':>8} {'waves(s)':>9} {'B/task':>7} {'peak B':>7} "
+          f"{'wave us':>8} {'flow us':>8}")
+    for shape in args.shapes.split(","):
+        for size in sizes:
+            metrics = results[f"{shape}:{size}"] = measure(shape, size, args.dispatch_max)
+            print(f"{shape:<9} {size:>9} {metrics['waves']:>8} {metrics['build_s']:>8.3f} "
+                  f"{metrics['calculate_waves_s']:>9.4f} {metrics['task_bytes']:>7.0f} {metrics['peak_bytes']:>7.0f} "
+                  f"{metrics.get('dispatch_waves_us', float('nan')):>8.1f} "
+                  f"{metrics.get('dispatch_dataflow_us', float('nan')):>8.1f}")
+
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        Path(args.baseline).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.baseline).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    baseline_path = Path(args.baseline)
+    if not baseline_path.exists():
+        print("No baseline to compare against (run with --save-baseline)")
+        return
+    regressions = compare(results, json.loads(baseline_path.read_text())["results"], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions beyond {args.tolerance:.0%} against {baseline_path.name}")
+
+
+if __name__ == "__main__":
+    main()
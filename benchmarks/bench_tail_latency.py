@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Task latency tails on the mock backend: lognormal vs bimodal, with and without hedging"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.backends import MockBackend, RoleProfile
+from core.distributions import Bimodal, LogNormal
+from core.events import EventMetrics
+from core.hedging import HedgePolicy
+from core.orchestrator import ParallelOrchestrator, Task
+
+TASKS = 400
+CONCURRENCY = 16
+MEDIAN = 0.02  # Seconds per model call
+
+
+async def run(profile: RoleProfile, hedged: bool):
+    metrics = EventMetrics()
+    orchestrator = ParallelOrchestrator(
+        backend=MockBackend(default=profile, seed=7),
+        metrics=metrics,
+        hedging=HedgePolicy(quantile=0.9, budget=0.1, min_samples=20) if hedged else None
+    )
+    # Warm the latency histogram so hedging has a quantile to work with
+    for i in range(40):
+        await orchestrator.execute_task(Task(f"warm{i}", "backend_dev", "implement", params={"i": i}))
+
+    latencies = []
+    slots = asyncio.Semaphore(CONCURRENCY)
+    started = time.perf_counter()
+
+    async def timed(task: Task) -> None:
+        async with slots:
+            began = time.perf_counter()
+            await orchestrator.execute_task(task)
+            latencies.append(time.perf_counter() - began)
+
+    await asyncio.gather(*(timed(Task(f"t{i}", "backend_dev", "implement", params={"n": i}))
+                           for i in range(TASKS)))
+    makespan = time.perf_counter() - started
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)], makespan, metrics.counters
+
+
+def main():
+    print(f"{TASKS} tasks, {CONCURRENCY} at a time, median model latency {MEDIAN * 1000:.0f}ms")
+    print(f"{'distribution':<22} {'hedged':>6} {'p50':>8} {'p99':>8} {'makespan':>9}  hedges")
+    for name, distribution in [("lognormal:0.5", LogNormal(0.5)), ("bimodal:0.05:20", Bimodal(0.05, 20))]:
+        for hedged in (False, True):
+            p50, p99, makespan, counters = asyncio.run(run(RoleProfile(MEDIAN, distribution), hedged))
+            print(f"{name:<22} {str(hedged):>6} {p50 * 1000:>6.0f}ms {p99 * 1000:>6.0f}ms {makespan:>8.2f}s"
+                  f"  {counters.get('hedge.launched', 0)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Memory per task: former dataclass Task vs slotted Task vs array-backed TaskTable"""
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.orchestrator import Task, TaskStatus
+from core.tasktable import TaskTable
+
+ROLES = ["product_owner", "backend_dev", "frontend_dev", "devops_eng", "qa_engineer", "tech_lead"]
+SIZE = 200_000
+
+
+@dataclass
+class LegacyTask:
+    """The previous dict-backed Task, kept for comparison"""
+    id: str
+    role: str
+    action: str
+    dependencies: List[str] = None
+    params: Dict[str, Any] = None
+    status: TaskStatus = TaskStatus.PENDING
+    result: Any = None
+    error: Optional[str] = None
+
+    def __post_init__(self):
+        if self.dependencies is None:
+            self.dependencies = []
+        if self.params is None:
+            self.params = {}
+
+
+def specs(size: int):
+    """(id, role, action, deps) rows: a chain-of-layers graph with 0-2 dependencies"""
+    for i in range(size):
+        deps = [f"t{i - 1}"] if i % 3 else []
+        if i % 7 == 0 and i > 10:
+            deps.append(f"t{i - 10}")
+        # Roles/actions arrive as fresh strings, as they would from parsed YAML or JSON
+        yield f"t{i}", "".join(ROLES[i % len(ROLES)]), "".join(["implement", "_api"]), deps
+
+
+def measure(label: str, build) -> None:
+    rows = list(specs(SIZE))
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    graph = build(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+    print(f"{label:<22} {(after - before) / SIZE:>8.1f} B/task")
+    return graph
+
+
+def main():
+    print(f"{SIZE} tasks (ids excluded; they are shared by every representation)")
+    measure("dataclass Task", lambda rows: [LegacyTask(i, r, a, list(d)) for i, r, a, d in rows])
+    measure("slotted Task", lambda rows: [Task(i, r, a, d) for i, r, a, d in rows])
+
+    def build_table(rows):
+        table = TaskTable()
+        for i, r, a, d in rows:
+            table.add(i, r, a, d)
+        return table
+    measure("TaskTable", build_table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Synthetic task graphs for the benchmark suite: wide, deep, random and workflow-shaped"""
+import random
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import yaml
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.orchestrator import Task
+from core.plan import compile_workflow
+
+ROLES = ["product_owner", "backend_dev", "frontend_dev", "devops_eng", "qa_engineer", "tech_lead"]
+WORKFLOWS = Path(__file__).parent.parent / "workflows"
+
+
+def wide(size: int, seed: int = 0) -> List[Task]:
+    """Fan-out/fan-in: one root, `size - 2` independent tasks, one sink"""
+    if size < 3:
+        return deep(size)
+    middle = [Task(f"t{i}", ROLES[i % len(ROLES)], "bench", ["root"]) for i in range(size - 2)]
+    return [Task("root", "product_owner", "bench"), *middle,
+            Task("sink", "tech_lead", "bench", [t.id for t in middle])]
+
+
+def deep(size: int, seed: int = 0) -> List[Task]:
+    """A single dependency chain"""
+    return [Task(f"t{i}", ROLES[i % len(ROLES)], "bench", [f"t{i - 1}"] if i else []) for i in range(size)]
+
+
+def random_dag(size: int, seed: int = 0, fan_in: int = 3, window: int = 1000) -> List[Task]:
+    """Each task depends on up to `fan_in` of the previous `window` tasks"""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(size):
+        deps = {f"t{rng.randrange(max(0, i - window), i)}" for _ in range(rng.randint(0, fan_in))} if i else set()
+        tasks.append(Task(f"t{i}", ROLES[i % len(ROLES)], "bench", sorted(deps)))
+    return tasks
+
+
+@lru_cache(maxsize=None)
+def _workflow_plan(name: str):
+    with open(WORKFLOWS / f"{name}.yaml") as f:
+        return compile_workflow(yaml.safe_load(f))
+
+
+def workflow(size: int, seed: int = 0, name: str = "sprint") -> List[Task]:
+    """Back-to-back copies of a real workflow's stage graphs, each copy gated on the previous one"""
+    plan = _workflow_plan(name)
+    template = [(spec, stage_index) for stage_index, stage in enumerate(plan.stages) for spec in stage.tasks]
+    stage_sinks: Dict[int, List[str]] = {}
+    for spec, stage_index in template:
+        if not any(spec.id in other.dependencies for other, _ in template):
+            stage_sinks.setdefault(stage_index, []).append(spec.id)
+
+    tasks: List[Task] = []
+    gate: List[str] = []  # Sinks of the previous stage (or copy)
+    copy = 0
+    while len(tasks) < size:
+        for stage_index, stage in enumerate(plan.stages):
+            for spec in stage.tasks:
+                if len(tasks) == size:
+                    return tasks
+                deps = [f"{d}#{copy}" for d in spec.dependencies] or list(gate)
+                tasks.append(Task(f"{spec.id}#{copy}", spec.role, spec.action, deps))
+            gate = [f"{sink}#{copy}" for sink in stage_sinks.get(stage_index, [])]
+        copy += 1
+    return tasks
+
+
+SHAPES: Dict[str, Callable[..., List[Task]]] = {
+    "wide": wide,
+    "deep": deep,
+    "random": random_dag,
+    "workflow": workflow,
+}
@@ -5,7 +5,6 @@ Enhanced with TechLead, hooks, and git operations
 """
 import click
 import json
-import asyncio
 import yaml
 from pathlib import Path
 from datetime import datetime
@@ -15,13 +14,23 @@ from typing import Dict, Any
 import sys
 sys.path.append(str(Path(__file__).parent))
 
-from core.orchestrator import ParallelOrchestrator, Task
+from core.orchestrator import ParallelOrchestrator, ResultSynthesizer, Task
 from core.context import ContextManager
 from core.events import event_bus, EventType, emit_event
 from core.hooks import HooksRunner
+from core.broker import SQLiteBroker
+from core.checkpoint import RunJournal
+from core.distributed import BrokerExecutor, Worker
+from core.incremental import FingerprintStore
+from core.plan import ExecutionPlan, load_plan
+from core.distributions import Distribution
+from core.simulation import sweep
+from core import runtime
 from tools.requirements.ears_generator import EARSGenerator
+import itertools
 import subprocess
 import os
+import time
 
 # Rich for beautiful terminal output
 try:
@@ -32,10 +41,41 @@ try:
 except ImportError:
     # Fallback to basic print
     class Console:
+        def __init__(self, stderr: bool = False):
+            self.stderr = stderr
+
         def print(self, *args, **kwargs):
-            print(*args)
+            print(*args, file=sys.stderr if self.stderr else sys.stdout)
     console = Console()
 
+def _load_squad_config() -> Dict[str, Any]:
+    """Load claude.yaml next to this CLI (empty config if missing)"""
+    config_path = Path(__file__).parent / "claude.yaml"
+    if not config_path.exists():
+        return {}
+    with open(config_path) as f:
+        return yaml.safe_load(f) or {}
+
+def _writes_stdout(stream) -> bool:
+    """Whether a click.File stream is stdout (the "-" argument)"""
+    try:
+        return stream.fileno() == sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+def _task_record(task: Task) -> Dict[str, Any]:
+    """One NDJSON line describing a finished task"""
+    return {
+        "id": task.id,
+        "role": task.role,
+        "action": task.action,
+        "status": task.status.value,
+        "attempts": task.attempts,
+        "error": task.error,
+        "result": task.result,
+        "timestamp": datetime.now().isoformat()
+    }
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -80,16 +120,17 @@ def init(project_name: str, tech_stack: str):
 @cli.command()
 @click.argument('description')
 @click.option('--sprint-days', default=6, help='Sprint duration in days')
-def feature(description: str, sprint_days: int):
+@click.option('--dataflow/--waves', default=False, help='Start each task as soon as its dependencies finish')
+def feature(description: str, sprint_days: int, dataflow: bool):
     """Start developing a new feature"""
     console.print(f"[bold blue]🎯 Starting feature: {description}[/bold blue]")
     
     # Run the feature workflow
-    asyncio.run(_run_feature_workflow(description, sprint_days))
+    runtime.run(_run_feature_workflow(description, sprint_days, dataflow), _load_squad_config())
 
-async def _run_feature_workflow(description: str, sprint_days: int):
+async def _run_feature_workflow(description: str, sprint_days: int, dataflow: bool = False):
     """Execute the feature development workflow"""
-    orchestrator = ParallelOrchestrator()
+    orchestrator = ParallelOrchestrator.from_config(_load_squad_config(), dataflow=dataflow)
     context_mgr = ContextManager()
     
     # Set up event logging
@@ -150,13 +191,14 @@ async def _run_feature_workflow(description: str, sprint_days: int):
     ) as progress:
         task_progress = progress.add_task("Executing tasks...", total=len(tasks))
         
-        results = await orchestrator.execute_wave(tasks)
-        
-        for result in results:
-            progress.update(task_progress, advance=1)
+        # Advance as each task finishes rather than after the whole graph
+        synthesizer = ResultSynthesizer()
+        async for result in orchestrator.stream(tasks):
+            synthesizer.add(result)
+            progress.update(task_progress, advance=1, description=f"{result.id}: {result.status.value}")
     
     # Show results
-    synthesis = orchestrator.synthesize_results(results)
+    synthesis = synthesizer.synthesis()
     
     table = Table(title="Sprint Results")
     table.add_column("Role", style="cyan")
@@ -228,50 +270,209 @@ def status():
                 console.print(f"  {task}: {duration:.1f}s")
 
 @cli.command()
-@click.argument('workflow', type=click.Choice(['sprint', 'hotfix', 'refactor']))
-@click.argument('description')
-def run(workflow: str, description: str):
+@click.argument('workflow', type=click.Choice(['sprint', 'hotfix', 'refactor']), required=False)
+@click.argument('description', required=False)
+@click.option('--dataflow/--waves', default=False, help='Start each task as soon as its dependencies finish')
+@click.option('--max-concurrency', type=int, default=None, help='Limit concurrently running tasks (critical path first)')
+@click.option('--full', is_flag=True, help='Re-run every task, ignoring results from the previous run')
+@click.option('--explain', is_flag=True, help='Show why each task re-ran or was reused')
+@click.option('--resume', 'resume_id', default=None, help='Continue an interrupted run from its checkpoints')
+@click.option('--broker', 'broker_path', default=None, help='Dispatch tasks to `claude-squad worker` processes via this broker DB')
+@click.option('--fail-fast', is_flag=True, help='Cancel in-flight tasks and stop at the first failure')
+@click.option('--ndjson', 'ndjson', type=click.File('w'), default=None, help='Write one JSON line per finished task ("-" for stdout)')
+def run(workflow: str, description: str, dataflow: bool, max_concurrency: int, full: bool, explain: bool,
+        resume_id: str, broker_path: str, fail_fast: bool, ndjson):
     """Run a predefined workflow"""
+    # NDJSON on stdout must stay machine-readable: progress goes to stderr instead
+    if ndjson is not None and _writes_stdout(ndjson):
+        global console
+        console = Console(stderr=True)
+    
+    # Checkpoint journal: resume an existing run or start a new one
+    journal = RunJournal(resume_id)
+    if resume_id:
+        if not journal.exists:
+            console.print(f"[red]❌ Run '{resume_id}' not found[/red]")
+            return
+        workflow = journal.header.get("workflow", workflow)
+        description = journal.header.get("description", description)
+        console.print(f"[dim]Resuming run {resume_id}: {len(journal.completed_ids())} tasks already completed[/dim]")
+    elif not workflow or not description:
+        raise click.UsageError("WORKFLOW and DESCRIPTION are required unless --resume is given")
+    
     console.print(f"[bold magenta]🔄 Running {workflow} workflow: {description}[/bold magenta]")
     
-    # Load workflow configuration
+    # Load the compiled workflow plan (recompiled only when the YAML changes)
     workflow_path = Path(f"claude-squad-5/workflows/{workflow}.yaml")
     if not workflow_path.exists():
         console.print(f"[red]❌ Workflow '{workflow}' not found[/red]")
         return
     
-    with open(workflow_path) as f:
-        config = yaml.safe_load(f)
+    plan = load_plan(str(workflow_path))
+    
+    console.print(f"[dim]Duration: {plan.duration}[/dim]")
+    console.print(f"[dim]Stages: {len(plan.stages)}[/dim]")
+    
+    if not resume_id:
+        journal.start(workflow=workflow, description=description)
+    console.print(f"[dim]Run ID: {journal.run_id} (resume with --resume {journal.run_id})[/dim]")
     
-    console.print(f"[dim]Duration: {config['duration']}[/dim]")
-    console.print(f"[dim]Stages: {len(config['stages'])}[/dim]")
+    # Fingerprints from the previous run of this workflow
+    state = FingerprintStore(f".claude-squad/state/{workflow}.json")
+    if full:
+        state.records.clear()
     
     # Execute workflow
-    asyncio.run(_execute_workflow(config, description))
+    try:
+        runtime.run(_execute_workflow(plan, description, dataflow, max_concurrency, state, explain, journal,
+                                      broker_path, fail_fast, ndjson, full), _load_squad_config())
+    finally:
+        journal.close()
 
-async def _execute_workflow(config: Dict[str, Any], description: str):
-    """Execute a workflow configuration"""
-    orchestrator = ParallelOrchestrator()
+async def _execute_workflow(plan: ExecutionPlan, description: str, dataflow: bool = False,
+                            max_concurrency: int = None, state: FingerprintStore = None,
+                            explain: bool = False, journal: RunJournal = None, broker_path: str = None,
+                            fail_fast: bool = False, ndjson=None, full: bool = False):
+    """Execute a compiled workflow plan"""
+    # --full re-runs everything, so cached results from earlier runs are bypassed too
+    overrides = {"cache": None} if full else {}
+    orchestrator = ParallelOrchestrator.from_config(
+        _load_squad_config(), dataflow=dataflow, max_concurrency=max_concurrency,
+        incremental=state, journal=journal, fail_fast=fail_fast, policies=plan.policies, **overrides
+    )
+    if broker_path:
+        orchestrator.set_executor(BrokerExecutor(SQLiteBroker(broker_path), run_id=journal.run_id if journal else None))
+    
+    # Graphs were validated when the plan was compiled; fail before any work runs
+    if not plan.ok:
+        for stage in plan.stages:
+            if not stage.validation.ok:
+                console.print(f"[red]❌ Stage '{stage.key}': {stage.validation.describe()}[/red]")
+        return
     
-    for stage_name, stage in config["stages"].items():
-        console.print(f"\n[yellow]▶️  Stage: {stage['name']}[/yellow]")
+    for stage in plan.stages:
+        console.print(f"\n[yellow]▶️  Stage: {stage.name}[/yellow]")
+        if stage.critical_path:
+            console.print(f"[dim]Critical path: {' -> '.join(stage.critical_path)} "
+                          f"({stage.critical_seconds / 3600:.1f}h)[/dim]")
         
-        # Convert stage tasks to Task objects
-        tasks = []
-        for task_config in stage.get("tasks", []):
-            task = Task(
-                id=task_config["id"],
-                role=task_config["role"],
-                action=task_config["action"],
-                dependencies=task_config.get("dependencies", []),
-                params={"description": description}
-            )
-            tasks.append(task)
+        # Fresh Task objects for this run
+        tasks = stage.instantiate(description)
         
-        # Execute stage
+        # Execute stage, reporting each task as it finishes
         if tasks:
-            results = await orchestrator.execute_wave(tasks)
-            console.print(f"[green]✅ Completed {len([r for r in results if r.status.value == 'completed'])} tasks[/green]")
+            synthesizer = ResultSynthesizer(keep_results=False)
+            reused = 0
+            async for r in orchestrator.stream(tasks):
+                synthesizer.add(r)
+                reused += bool(r.meta("reused"))
+                if ndjson is not None:
+                    ndjson.write(json.dumps({"stage": stage.key, **_task_record(r)}, default=str) + "\n")
+                    ndjson.flush()
+                if explain:
+                    if r.meta("resumed"):
+                        reason = "restored from checkpoint"
+                    elif r.meta("reused"):
+                        reason = "up to date"
+                    elif r.meta("cached"):
+                        reason = f"result cache hit ({r.meta('rerun_reason', 'identical inputs')})"
+                    else:
+                        reason = r.meta("rerun_reason", r.status.value)
+                    console.print(f"[dim]  {r.id}: {reason}[/dim]")
+            
+            metrics = synthesizer.synthesis()["metrics"]
+            console.print(f"[green]✅ Completed {metrics['completed']} tasks ({reused} up to date)[/green]")
+            if metrics["failed"] or metrics["skipped"] or metrics["cancelled"]:
+                console.print(f"[red]❌ {metrics['failed']} failed, {metrics['skipped']} skipped, "
+                              f"{metrics['cancelled']} cancelled[/red]")
+                if fail_fast and metrics["failed"]:
+                    break
+    
+    # Role pool pressure across the whole run
+    for role, stats in orchestrator.pool_stats().items():
+        utilization = f"{stats['utilization']:.0%}" if stats["utilization"] is not None else "unbounded"
+        console.print(f"[dim]{role}: limit {stats['limit'] or '-'}, peak queue {stats['max_queued']}, "
+                      f"avg wait {stats['avg_wait_seconds']:.1f}s, utilization {utilization}[/dim]")
+    if orchestrator.admission is not None:
+        stats = orchestrator.admission.stats
+        avg_wait = stats["wait_seconds"] / stats["waited"] if stats["waited"] else 0.0
+        console.print(f"[dim]admission: peak {stats['max_in_flight']} in flight, peak queue {stats['max_queued']}, "
+                      f"{stats['waited']} waited (avg {avg_wait:.1f}s), {stats['rejected']} rejected[/dim]")
+
+def _parse_role_values(entries) -> Dict[str, list]:
+    """ROLE=1,2,3 options -> {role: [1, 2, 3]}"""
+    parsed = {}
+    for entry in entries:
+        role, _, values = entry.partition("=")
+        if not values:
+            raise click.BadParameter(f"Expected ROLE=N[,N...], got {entry!r}")
+        parsed[role] = [int(value) for value in values.split(",")]
+    return parsed
+
+@cli.command()
+@click.argument('workflow', type=click.Choice(['sprint', 'hotfix', 'refactor']))
+@click.option('--set', 'fixed', multiple=True, help='Role slot count, e.g. --set qa_engineer=1')
+@click.option('--vary', multiple=True, help='Slot counts to compare, e.g. --vary backend_dev=1,2,3')
+@click.option('--runs', default=1000, help='Sampled scenarios per configuration')
+@click.option('--latency', default='fixed', help='Duration noise: fixed, lognormal:SIGMA or bimodal:P_SLOW:FACTOR')
+@click.option('--seed', type=int, default=None, help='Random seed (same samples for every configuration)')
+@click.option('--dataflow/--waves', default=False, help='Start each task as soon as its dependencies finish')
+@click.option('--max-concurrency', type=int, default=None, help='Global limit on concurrently running tasks')
+@click.option('--json', 'as_json', is_flag=True, help='Print the summaries as JSON')
+def simulate(workflow: str, fixed, vary, runs: int, latency: str, seed: int, dataflow: bool,
+             max_concurrency: int, as_json: bool):
+    """Estimate makespan and role utilization on a virtual clock (no tasks run)"""
+    workflow_path = Path(f"claude-squad-5/workflows/{workflow}.yaml")
+    if not workflow_path.exists():
+        console.print(f"[red]❌ Workflow '{workflow}' not found[/red]")
+        return
+    plan = load_plan(str(workflow_path))
+    if not plan.ok:
+        console.print(f"[red]❌ Workflow '{workflow}' has an invalid task graph; see `claude-squad run`[/red]")
+        return
+    
+    team = _load_squad_config().get("team") or {}
+    base = {role: int(limit) for role, limit in (team.get("concurrency") or {}).items()}
+    base.update({role: values[0] for role, values in _parse_role_values(fixed).items()})
+    varied = _parse_role_values(vary)
+    scenarios = [dict(base, **dict(zip(varied, combo))) for combo in itertools.product(*varied.values())]
+    
+    started = time.perf_counter()
+    results = sweep(plan, scenarios, runs=runs, default_limit=team.get("default_concurrency"),
+                    global_limit=max_concurrency, dataflow=dataflow,
+                    latency=Distribution.from_spec(latency), seed=seed)
+    elapsed = time.perf_counter() - started
+    
+    if as_json:
+        print(json.dumps([{"limits": limits, **summary} for limits, summary in results], indent=2))
+        return
+    
+    for limits, summary in results:
+        label = ", ".join(f"{role}={limits[role]}" for role in varied) or "configured limits"
+        console.print(f"\n[bold]{label}[/bold]: makespan {summary['makespan_mean'] / 3600:.1f}h "
+                      f"(p50 {summary['makespan_p50'] / 3600:.1f}h, p90 {summary['makespan_p90'] / 3600:.1f}h)")
+        for role, stats in summary["roles"].items():
+            utilization = f"{stats['utilization']:.0%}" if stats["utilization"] is not None else "unbounded"
+            console.print(f"[dim]  {role}: limit {stats['limit'] or '-'}, utilization {utilization}, "
+                          f"avg wait {stats['avg_wait_seconds'] / 3600:.2f}h, peak queue {stats['max_queued']}[/dim]")
+    console.print(f"\n[dim]{len(scenarios) * runs} scenarios in {elapsed:.2f}s[/dim]")
+
+@cli.command()
+@click.option('--broker', 'broker_path', default='.claude-squad/broker.db', help='Broker DB shared with the coordinator')
+@click.option('--lease', 'lease_seconds', default=30.0, help='Lease duration in seconds (renewed by heartbeats)')
+@click.option('--max-tasks', type=int, default=None, help='Exit after recording this many results')
+@click.option('--exit-when-idle', is_flag=True, help='Exit once the queue is empty')
+def worker(broker_path: str, lease_seconds: float, max_tasks: int, exit_when_idle: bool):
+    """Execute tasks leased from a coordinator's broker"""
+    node = Worker(SQLiteBroker(broker_path), lease_seconds=lease_seconds)
+    console.print(f"[bold blue]👷 Worker {node.worker_id} serving {broker_path}[/bold blue]")
+    
+    try:
+        runtime.run(node.run(max_tasks=max_tasks, stop_when_idle=exit_when_idle), _load_squad_config())
+    except KeyboardInterrupt:
+        pass
+    console.print(f"[green]✅ Processed {node.processed} tasks ({node.failed} failed, "
+                  f"{node.lost} lost to expired or withdrawn leases)[/green]")
 
 @cli.command()
 def docs():
@@ -294,7 +495,7 @@ def commit(message: str, notify: bool):
     
     # Run hooks
     hooks = HooksRunner()
-    result = asyncio.run(hooks.run_hooks("pre-commit"))
+    result = runtime.run(hooks.run_hooks("pre-commit"), _load_squad_config())
     
     if result['success']:
         console.print(f"[green]✅ All hooks passed![/green]")
@@ -322,7 +523,7 @@ def pr(title: str, base: str):
     
     # Run pre-push hooks
     hooks = HooksRunner()
-    result = asyncio.run(hooks.run_hooks("pre-push"))
+    result = runtime.run(hooks.run_hooks("pre-push"), _load_squad_config())
     
     if result['success']:
         console.print(f"[green]✅ Quality checks passed![/green]")
@@ -353,7 +554,7 @@ def merge(squash: bool):
         action="perform_review"
     )
     
-    result = asyncio.run(orchestrator.execute_task(task))
+    result = runtime.run(orchestrator.execute_task(task), _load_squad_config())
     
     if result.result['review_status'] == 'approved':
         console.print(f"[green]✅ TechLead approved merge![/green]")
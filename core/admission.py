@@ -0,0 +1,98 @@
+"""
+Claude Squad 6 - Admission Control
+Bounds in-flight and queued tasks so submission spikes apply backpressure
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a submission finds the admission queue full"""
+
+
+class AdmissionController:
+    """At most `max_in_flight` admitted tasks, at most `max_queued` waiting.
+
+    `admit` returns immediately while there is room, otherwise waits FIFO for
+    a slot; when `max_queued` callers are already waiting (or `wait=False`)
+    it raises AdmissionRejected instead. Callers whose work was already
+    accepted, such as the rest of a running task graph, pass
+    `reject=False`: they still wait for a slot and count towards the queue,
+    but are never turned away. Every admitted caller must `release`.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.clock = clock
+        self.in_flight = 0
+        self.queued = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.stats = {"admitted": 0, "rejected": 0, "waited": 0, "wait_seconds": 0.0,
+                      "max_in_flight": 0, "max_queued": 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["AdmissionController"]:
+        """Build from the `admission` section of claude.yaml (None if unlimited)"""
+        max_in_flight = config.get("max_in_flight")
+        max_queued = config.get("max_queued")
+        if max_in_flight is None and max_queued is None:
+            return None
+        return cls(max_in_flight, max_queued)
+
+    @property
+    def full(self) -> bool:
+        return self.max_in_flight is not None and (self.in_flight >= self.max_in_flight or bool(self.queued))
+
+    async def admit(self, wait: bool = True, reject: bool = True) -> float:
+        """Take an in-flight slot, waiting if needed; returns seconds waited"""
+        if not self.full:
+            self._take()
+            return 0.0
+        if reject and (not wait or (self.max_queued is not None and self.queued >= self.max_queued)):
+            self.stats["rejected"] += 1
+            raise AdmissionRejected(f"Admission queue full ({self.in_flight} in flight, {self.queued} queued)")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        self.stats["max_queued"] = max(self.stats["max_queued"], self.queued)
+        started = self.clock()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # Slot handed over just before the cancel landed
+            else:
+                self.queued -= 1
+            raise
+
+        waited = self.clock() - started
+        self.stats["waited"] += 1
+        self.stats["wait_seconds"] += waited
+        return waited
+
+    def _take(self) -> None:
+        self.in_flight += 1
+        self.stats["admitted"] += 1
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.in_flight)
+
+    def release(self) -> None:
+        """Return a slot, handing it to the oldest live waiter"""
+        self.in_flight -= 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.queued -= 1
+                self._take()
+                waiter.set_result(None)
+                return
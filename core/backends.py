@@ -0,0 +1,114 @@
+"""
+Claude Squad 6 - Model Backends
+The model call behind each role handler, with a configurable offline mock
+"""
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .distributions import Distribution, Fixed
+
+
+class ModelError(RuntimeError):
+    """A failed model call (retryable under the task's policy)"""
+
+
+@dataclass
+class ModelResponse:
+    input_tokens: int
+    output_tokens: int
+    latency: float
+
+
+class RoleBackend:
+    """Performs the model request for one task, or one batch of same-role tasks"""
+
+    async def call(self, role: str, input_tokens: int, batch_size: int = 1) -> ModelResponse:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Release any resources held by the backend"""
+
+
+class SleepBackend(RoleBackend):
+    """Fixed-latency placeholder (the default until a real client is plugged in)"""
+
+    def __init__(self, latency: float = 0.1):
+        self.latency = latency
+
+    async def call(self, role: str, input_tokens: int, batch_size: int = 1) -> ModelResponse:
+        await asyncio.sleep(self.latency)
+        return ModelResponse(input_tokens, 0, self.latency)
+
+
+@dataclass
+class RoleProfile:
+    latency: float = 0.1  # Median seconds per call
+    distribution: Distribution = field(default_factory=Fixed)
+    error_rate: float = 0.0
+    output_tokens: int = 400  # Per task; a batch of n produces n times as many
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], base: Optional["RoleProfile"] = None) -> "RoleProfile":
+        base = base or cls()
+        return cls(
+            latency=float(config.get("latency", base.latency)),
+            distribution=Distribution.from_spec(config["distribution"]) if "distribution" in config
+            else base.distribution,
+            error_rate=float(config.get("error_rate", base.error_rate)),
+            output_tokens=int(config.get("output_tokens", base.output_tokens))
+        )
+
+
+class MockBackend(RoleBackend):
+    """Offline stand-in with per-role latency distributions and injected errors.
+
+    Each call sleeps `latency * distribution.sample()` seconds and then fails
+    with probability `error_rate`, so tail latency, retries and hedging can be
+    load-tested without a model API. Pass `seed` for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        roles: Optional[Dict[str, RoleProfile]] = None,
+        default: Optional[RoleProfile] = None,
+        seed: Optional[int] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        self.roles = dict(roles or {})
+        self.default = default or RoleProfile()
+        self.rng = random.Random(seed)
+        self.sleep = sleep
+        self.stats = {"calls": 0, "errors": 0, "input_tokens": 0, "output_tokens": 0, "latency_seconds": 0.0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "MockBackend":
+        """Build from the `backend` section of claude.yaml"""
+        default = RoleProfile.from_config(config.get("default") or {})
+        roles = {role: RoleProfile.from_config(c or {}, default) for role, c in (config.get("roles") or {}).items()}
+        return cls(roles, default, seed=config.get("seed"))
+
+    async def call(self, role: str, input_tokens: int, batch_size: int = 1) -> ModelResponse:
+        profile = self.roles.get(role, self.default)
+        latency = profile.latency * profile.distribution.sample(self.rng)
+        failed = self.rng.random() < profile.error_rate
+
+        self.stats["calls"] += 1
+        self.stats["input_tokens"] += input_tokens
+        self.stats["latency_seconds"] += latency
+        await self.sleep(latency)
+
+        if failed:
+            self.stats["errors"] += 1
+            raise ModelError(f"Injected {role} model error")
+        output_tokens = profile.output_tokens * batch_size
+        self.stats["output_tokens"] += output_tokens
+        return ModelResponse(input_tokens, output_tokens, latency)
+
+
+def backend_from_config(config: Dict[str, Any]) -> RoleBackend:
+    """`backend: {type: mock, ...}` in claude.yaml; the sleep placeholder otherwise"""
+    if config.get("type") == "mock":
+        return MockBackend.from_config(config)
+    return SleepBackend(float(config.get("latency", 0.1)))
@@ -0,0 +1,88 @@
+"""
+Claude Squad 6 - Role Batching
+Groups ready same-role tasks into one model call and demultiplexes the results
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+
+class _Batch:
+    __slots__ = ("items", "futures", "timer")
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.futures: List[asyncio.Future] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class RoleBatcher:
+    """Collects submissions per key for up to `window` seconds or `max_batch` items.
+
+    When a batch closes, `flush(key, items)` runs once for the whole batch and
+    must return one result per item, in order; a result that is an exception
+    fails only its own submission. A submitter cancelled before the flush is
+    dropped from the batch; after the flush its result is discarded.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Hashable, List[Any]], Awaitable[List[Any]]],
+        window: float = 0.02,
+        max_batch: int = 8
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.flush = flush
+        self.window = window
+        self.max_batch = max_batch
+        self.pending: Dict[Hashable, _Batch] = {}
+        self.flushing: Set[asyncio.Task] = set()  # Strong references: the loop only keeps weak ones
+        self.stats = {"batches": 0, "items": 0, "max_size": 0}
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """Add `item` to the open batch for `key` and wait for its result"""
+        batch = self.pending.get(key)
+        if batch is None:
+            batch = self.pending[key] = _Batch()
+            batch.timer = asyncio.get_running_loop().call_later(self.window, self._close, key, batch)
+
+        future = asyncio.get_running_loop().create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        if len(batch.items) >= self.max_batch:
+            self._close(key, batch)
+        return await future
+
+    def _close(self, key: Hashable, batch: _Batch) -> None:
+        if self.pending.get(key) is batch:
+            del self.pending[key]
+        batch.timer.cancel()
+
+        live = [i for i, future in enumerate(batch.futures) if not future.done()]
+        if not live:
+            return
+        items = [batch.items[i] for i in live]
+        futures = [batch.futures[i] for i in live]
+        self.stats["batches"] += 1
+        self.stats["items"] += len(items)
+        self.stats["max_size"] = max(self.stats["max_size"], len(items))
+        flushing = asyncio.ensure_future(self._run(key, items, futures))
+        self.flushing.add(flushing)
+        flushing.add_done_callback(self.flushing.discard)
+
+    async def _run(self, key: Hashable, items: List[Any], futures: List[asyncio.Future]) -> None:
+        try:
+            results = await self.flush(key, items)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            results = [e] * len(items)
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,149 @@
+"""
+Claude Squad 6 - Task Broker
+SQLite-backed work queue with leases, heartbeats and redelivery
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, enqueued_at);
+"""
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"  # Withdrawn by the coordinator; never leased again
+
+
+class SQLiteBroker:
+    """Single-file broker shared by a coordinator and any number of workers.
+
+    A task is leased to one worker for `lease_seconds`; the worker must
+    heartbeat before the lease expires or the task is redelivered to the next
+    worker that asks. After `max_attempts` deliveries it is marked failed.
+    Suitable for local and test use; the interface is what a networked broker
+    would implement. Methods are thread-safe, so a coordinator can call them
+    from `asyncio.to_thread` instead of blocking its event loop.
+    """
+
+    def __init__(self, path: str = ".claude-squad/broker.db", max_attempts: int = 3):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self.lock = threading.Lock()  # One statement or transaction at a time on the shared connection
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Enqueue a task payload (re-queues a finished key)"""
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO tasks (key, payload, state, attempts, enqueued_at, updated_at) "
+                "VALUES (?, ?, ?, 0, ?, ?)",
+                (key, json.dumps(payload, default=str), QUEUED, now, now)
+            )
+
+    def lease(self, worker: str, lease_seconds: float = 30.0) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Claim the oldest queued task, redelivering any whose lease expired"""
+        now = time.time()
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self.db.execute(
+                    "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, worker = NULL, "
+                    "error = CASE WHEN attempts >= ? THEN 'lease expired too many times' ELSE error END, "
+                    "updated_at = ? WHERE state = ? AND lease_expires < ?",
+                    (self.max_attempts, FAILED, QUEUED, self.max_attempts, now, LEASED, now)
+                )
+                row = self.db.execute(
+                    "SELECT key, payload FROM tasks WHERE state = ? ORDER BY enqueued_at LIMIT 1", (QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    self.db.execute(
+                        "UPDATE tasks SET state = ?, worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                        "updated_at = ? WHERE key = ?",
+                        (LEASED, worker, now + lease_seconds, now, row[0])
+                    )
+                self.db.execute("COMMIT")
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+        return (row[0], json.loads(row[1])) if row else None
+
+    def _update(self, sql: str, params: tuple) -> bool:
+        with self.lock:
+            return self.db.execute(sql, params).rowcount == 1
+
+    def heartbeat(self, key: str, worker: str, lease_seconds: float = 30.0) -> bool:
+        """Extend a lease; False means the lease was lost (redelivered or cancelled)"""
+        now = time.time()
+        return self._update(
+            "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE key = ? AND worker = ? AND state = ?",
+            (now + lease_seconds, now, key, worker, LEASED)
+        )
+
+    def ack(self, key: str, worker: str, result: Any) -> bool:
+        """Store a result for a task still leased by `worker`"""
+        return self._update(
+            "UPDATE tasks SET state = ?, result = ?, updated_at = ? WHERE key = ? AND worker = ? AND state = ?",
+            (DONE, json.dumps(result, default=str), time.time(), key, worker, LEASED)
+        )
+
+    def fail(self, key: str, worker: str, error: str) -> bool:
+        """Record a handler failure for a task still leased by `worker`"""
+        return self._update(
+            "UPDATE tasks SET state = ?, error = ?, updated_at = ? WHERE key = ? AND worker = ? AND state = ?",
+            (FAILED, error, time.time(), key, worker, LEASED)
+        )
+
+    def cancel(self, key: str) -> bool:
+        """Withdraw a queued or leased task; a worker holding it loses its lease"""
+        return self._update(
+            "UPDATE tasks SET state = ?, worker = NULL, updated_at = ? WHERE key = ? AND state IN (?, ?)",
+            (CANCELLED, time.time(), key, QUEUED, LEASED)
+        )
+
+    def status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Current state, result and error of a task"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT state, result, error, attempts FROM tasks WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        state, result, error, attempts = row
+        return {
+            "state": state,
+            "result": json.loads(result) if result is not None else None,
+            "error": error,
+            "attempts": attempts
+        }
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per state"""
+        with self.lock:
+            return dict(self.db.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state").fetchall())
+
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
@@ -0,0 +1,149 @@
+"""
+Claude Squad 6 - Task Result Cache
+Content-addressed memoization with an in-memory LRU and an on-disk tier
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+def stable_hash(value: Any) -> str:
+    """SHA-256 of a canonical JSON encoding (sorted keys, str() fallback)"""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def task_cache_key(role: str, action: str, params: Dict[str, Any],
+                   upstream: List[Tuple[str, Any]], persona_version: str) -> str:
+    """Key for a task execution: identical inputs must produce identical keys"""
+    return stable_hash({
+        "role": role,
+        "action": action,
+        "params": params,
+        "upstream": upstream,
+        "persona_version": persona_version
+    })
+
+
+class ResultCache:
+    """Two-tier result cache.
+
+    The memory tier is an LRU bounded by entry count; the disk tier stores one
+    JSON file per key under `directory` and evicts least recently used files
+    once `max_disk_bytes` is exceeded. Results that are not JSON-serializable
+    stay in memory only.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = ".claude-squad/cache",
+        max_entries: int = 1024,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.memory: "OrderedDict[str, Any]" = OrderedDict()
+
+        # key -> size for the disk tier, least recently used first; scanned on first use
+        self._disk_index: "Optional[OrderedDict[str, int]]" = None
+        self.disk_bytes = 0
+
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    @property
+    def disk_index(self) -> "OrderedDict[str, int]":
+        """Disk entries in LRU order, rebuilt from file mtimes (access times) once per process"""
+        if self._disk_index is None:
+            entries = []
+            if self.directory and self.directory.exists():
+                for path in self.directory.glob("*/*.json"):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime, path.stem, stat.st_size))
+            entries.sort()
+            self._disk_index = OrderedDict((key, size) for _, key, size in entries)
+            self.disk_bytes = sum(self._disk_index.values())
+        return self._disk_index
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, result) for a key, checking memory then disk"""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return True, self.memory[key]
+
+        if self.directory is not None and key in self.disk_index:
+            path = self._path(key)
+            try:
+                with open(path) as f:
+                    value = json.load(f)["result"]
+            except (OSError, ValueError, KeyError):
+                self._drop_disk(key)
+            else:
+                os.utime(path)  # Keeps the LRU order for the next process
+                self.disk_index.move_to_end(key)
+                self.stats["disk_hits"] += 1
+                self._remember(key, value)
+                return True, value
+
+        self.stats["misses"] += 1
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a result in both tiers"""
+        self._remember(key, value)
+        if self.directory is None:
+            return
+
+        try:
+            encoded = json.dumps({"result": value})
+        except (TypeError, ValueError):
+            return  # Not serializable: memory tier only
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(encoded)
+        os.replace(tmp, path)
+
+        index = self.disk_index
+        if key in index:
+            self.disk_bytes -= index[key]
+        size = len(encoded.encode())
+        index[key] = size
+        index.move_to_end(key)
+        self.disk_bytes += size
+        self._evict_disk()
+
+    def _remember(self, key: str, value: Any) -> None:
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _drop_disk(self, key: str) -> None:
+        size = self.disk_index.pop(key)
+        self.disk_bytes -= size
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict_disk(self) -> None:
+        # Oldest first: O(1) per evicted entry
+        index = self.disk_index
+        while self.disk_bytes > self.max_disk_bytes and index:
+            self._drop_disk(next(iter(index)))
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        self.memory.clear()
+        if self.directory is not None:
+            for key in list(self.disk_index):
+                self._drop_disk(key)
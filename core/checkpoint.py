@@ -0,0 +1,93 @@
+"""
+Claude Squad 6 - Run Checkpoints
+Append-only journal of task outcomes so interrupted runs can resume
+"""
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+class RunJournal:
+    """Journal at `<root>/<run_id>/journal.jsonl`.
+
+    Every line is one self-contained JSON record written with flush+fsync,
+    so after a crash the file holds a prefix of complete records plus at most
+    one torn line, which `load` discards.
+    """
+
+    def __init__(self, run_id: Optional[str] = None, root: str = ".claude-squad/runs"):
+        self.run_id = run_id or self.new_run_id()
+        self.directory = Path(root) / self.run_id
+        self.path = self.directory / "journal.jsonl"
+        self.header: Dict[str, Any] = {}
+        self.tasks: Dict[str, Dict[str, Any]] = {}  # Latest record per task ID
+        self._file = None
+        if self.path.exists():
+            self.load()
+
+    @staticmethod
+    def new_run_id() -> str:
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> None:
+        """Replay the journal up to the last complete record"""
+        self.header, self.tasks = {}, {}
+        valid_bytes = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # Torn write at the tail: stop at the last consistent state
+                if not line.endswith(b"\n"):
+                    break
+                valid_bytes += len(line)
+                if record["type"] == "run.started":
+                    self.header = record
+                elif record["type"] == "task":
+                    self.tasks[record["id"]] = record
+
+        # Drop the torn tail so new records start on a clean line
+        if valid_bytes != self.path.stat().st_size:
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_bytes)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a")
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start(self, **header: Any) -> None:
+        """Write the run header (workflow, description, ...) for a new run"""
+        self.header = {"type": "run.started", "run_id": self.run_id,
+                       "timestamp": datetime.now().isoformat(), **header}
+        self._append(self.header)
+
+    def record_task(self, task_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        """Checkpoint one finished task"""
+        record = {"type": "task", "id": task_id, "status": status, "result": result, "error": error}
+        self.tasks[task_id] = record
+        self._append(record)
+
+    def completed(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """The checkpointed record if the task already completed"""
+        record = self.tasks.get(task_id)
+        return record if record and record["status"] == "completed" else None
+
+    def completed_ids(self) -> List[str]:
+        return [task_id for task_id, record in self.tasks.items() if record["status"] == "completed"]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
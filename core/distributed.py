@@ -0,0 +1,120 @@
+"""
+Claude Squad 6 - Distributed Execution
+Coordinator-side broker executor and the `claude-squad worker` loop
+"""
+import asyncio
+import os
+import socket
+import uuid
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from .broker import SQLiteBroker, DONE, FAILED
+from .executors import TaskExecutor
+
+if TYPE_CHECKING:
+    from .orchestrator import ParallelOrchestrator, Task
+
+
+class BrokerExecutor(TaskExecutor):
+    """Coordinator side: enqueue the task payload and wait for a worker's ack"""
+
+    def __init__(self, broker: SQLiteBroker, poll_interval: float = 0.05, run_id: Optional[str] = None):
+        self.broker = broker
+        self.poll_interval = poll_interval
+        self.run_id = run_id or uuid.uuid4().hex[:8]
+
+    async def run(self, orchestrator: "ParallelOrchestrator", task: "Task") -> Any:
+        key = f"{self.run_id}:{task.id}:{uuid.uuid4().hex[:8]}"
+        # Broker calls run in threads: sqlite may block up to its busy timeout
+        put = asyncio.ensure_future(asyncio.to_thread(self.broker.put, key, task.to_payload()))
+        try:
+            await asyncio.shield(put)
+            while True:
+                status = await asyncio.to_thread(self.broker.status, key)
+                if status["state"] == DONE:
+                    return status["result"]
+                if status["state"] == FAILED:
+                    raise RuntimeError(f"Remote execution failed after {status['attempts']} attempt(s): "
+                                       f"{status['error']}")
+                await asyncio.sleep(self.poll_interval)
+        except asyncio.CancelledError:
+            # Timeout, losing hedge or fail-fast: workers must not run the abandoned copy
+            await asyncio.shield(self._withdraw(put, key))
+            raise
+
+    async def _withdraw(self, put: asyncio.Future, key: str) -> None:
+        await asyncio.gather(put, return_exceptions=True)  # Never cancel before the row exists
+        await asyncio.to_thread(self.broker.cancel, key)
+
+    def shutdown(self) -> None:
+        self.broker.close()
+
+
+class Worker:
+    """Leases tasks from a broker, runs their role handlers and acks results.
+
+    While a handler runs, the lease is renewed every `lease_seconds / 3`; if
+    renewal fails the work has been redelivered elsewhere and the result is
+    discarded. `processed` and `failed` count results the broker accepted;
+    `lost` counts results rejected because the lease expired or the
+    coordinator withdrew the task.
+    """
+
+    def __init__(
+        self,
+        broker: SQLiteBroker,
+        factory: Optional[Callable[[], "ParallelOrchestrator"]] = None,
+        lease_seconds: float = 30.0,
+        idle_interval: float = 0.2,
+        worker_id: Optional[str] = None
+    ):
+        from .orchestrator import ParallelOrchestrator
+
+        self.broker = broker
+        self.orchestrator = (factory or ParallelOrchestrator)()
+        self.lease_seconds = lease_seconds
+        self.idle_interval = idle_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:4]}"
+        self.processed = 0
+        self.failed = 0
+        self.lost = 0
+
+    async def _heartbeat(self, key: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not self.broker.heartbeat(key, self.worker_id, self.lease_seconds):
+                return
+
+    async def run_once(self) -> bool:
+        """Process one task; False when the queue was empty"""
+        from .orchestrator import Task
+
+        leased = self.broker.lease(self.worker_id, self.lease_seconds)
+        if leased is None:
+            return False
+
+        key, payload = leased
+        heartbeat = asyncio.ensure_future(self._heartbeat(key))
+        try:
+            result = await self.orchestrator._execute_by_role(Task.from_payload(payload))
+        except Exception as e:
+            if self.broker.fail(key, self.worker_id, str(e)):
+                self.failed += 1
+            else:
+                self.lost += 1
+        else:
+            if self.broker.ack(key, self.worker_id, result):
+                self.processed += 1
+            else:
+                self.lost += 1
+        finally:
+            heartbeat.cancel()
+        return True
+
+    async def run(self, max_tasks: Optional[int] = None, stop_when_idle: bool = False) -> None:
+        """Serve tasks until `max_tasks` results are recorded or, optionally, the queue drains"""
+        while max_tasks is None or self.processed + self.failed < max_tasks:
+            if not await self.run_once():
+                if stop_when_idle:
+                    return
+                await asyncio.sleep(self.idle_interval)
@@ -0,0 +1,64 @@
+"""
+Claude Squad 6 - Latency Distributions
+Sampled latency noise shared by the simulator and the mock model backend
+"""
+import math
+import random
+
+
+class Distribution:
+    """Multiplicative latency noise: `sample()` returns a factor around 1"""
+
+    def sample(self, rng: random.Random) -> float:
+        raise NotImplementedError
+
+    @staticmethod
+    def from_spec(spec: str) -> "Distribution":
+        """Parse "fixed", "lognormal:SIGMA" or "bimodal:P_SLOW:SLOW_FACTOR" """
+        name, *args = spec.split(":")
+        try:
+            values = [float(arg) for arg in args]
+            if name == "fixed" and not values:
+                return Fixed()
+            if name == "lognormal":
+                return LogNormal(*values)
+            if name == "bimodal":
+                return Bimodal(*values)
+        except TypeError:
+            pass
+        raise ValueError(f"Unknown latency distribution: {spec!r}")
+
+
+class Fixed(Distribution):
+    def sample(self, rng: random.Random) -> float:
+        return 1.0
+
+    def __repr__(self) -> str:
+        return "fixed"
+
+
+class LogNormal(Distribution):
+    """Median 1; `sigma` is the spread of log-latency (0.5 puts p95 at ~2.3x)"""
+
+    def __init__(self, sigma: float = 0.5):
+        self.sigma = sigma
+
+    def sample(self, rng: random.Random) -> float:
+        return math.exp(rng.gauss(0.0, self.sigma))
+
+    def __repr__(self) -> str:
+        return f"lognormal:{self.sigma:g}"
+
+
+class Bimodal(Distribution):
+    """Usually 1, but a `p_slow` fraction of calls take `slow_factor` times longer"""
+
+    def __init__(self, p_slow: float = 0.05, slow_factor: float = 10.0):
+        self.p_slow = p_slow
+        self.slow_factor = slow_factor
+
+    def sample(self, rng: random.Random) -> float:
+        return self.slow_factor if rng.random() < self.p_slow else 1.0
+
+    def __repr__(self) -> str:
+        return f"bimodal:{self.p_slow:g}:{self.slow_factor:g}"
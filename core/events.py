@@ -4,7 +4,9 @@ Lightweight event system for tracking all team activities
 """
 import json
 import asyncio
-from typing import Dict, Any, List, Callable, Optional
+import itertools
+from collections import deque
+from typing import Deque, Dict, Any, List, Callable, Optional
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -125,10 +127,40 @@ class EventBus:
 class EventMetrics:
     """Track metrics from events"""
     
-    def __init__(self):
+    def __init__(self, window: int = 500):
         self.counts: Dict[str, int] = {}
-        self.durations: Dict[str, List[float]] = {}
+        # Only the most recent `window` samples per type are kept (for percentiles);
+        # averages use running totals so long-lived processes stay bounded
+        self.window = window
+        self.durations: Dict[str, Deque[float]] = {}
+        self.duration_totals: Dict[str, List[float]] = {}  # type -> [sum, count]
         self.errors: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}  # Component counters, e.g. cache hits
+        
+    def record_duration(self, task_type: str, seconds: float) -> None:
+        """Track a duration measured outside the event stream"""
+        if task_type not in self.durations:
+            self.durations[task_type] = deque(maxlen=self.window)
+            self.duration_totals[task_type] = [0.0, 0]
+        self.durations[task_type].append(seconds)
+        totals = self.duration_totals[task_type]
+        totals[0] += seconds
+        totals[1] += 1
+        
+    def percentile(self, task_type: str, quantile: float, window: int = 500) -> Optional[float]:
+        """Duration quantile over the most recent `window` samples (None without history)"""
+        samples = self.durations.get(task_type)
+        if not samples:
+            return None
+        recent = sorted(itertools.islice(samples, max(0, len(samples) - window), None))
+        return recent[min(len(recent) - 1, int(quantile * len(recent)))]
+        
+    def sample_count(self, task_type: str) -> int:
+        return len(self.durations.get(task_type, ()))
+        
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Bump a named counter outside the event stream"""
+        self.counters[name] = self.counters.get(name, 0) + amount
         
     def record(self, event: Event) -> None:
         """Record metrics from event"""
@@ -139,10 +171,7 @@ class EventMetrics:
         if event.type == EventType.TASK_COMPLETED:
             duration = event.data.get("duration_seconds")
             if duration:
-                task_type = event.data.get("task_type", "unknown")
-                if task_type not in self.durations:
-                    self.durations[task_type] = []
-                self.durations[task_type].append(duration)
+                self.record_duration(event.data.get("task_type", "unknown"), duration)
                 
         # Track errors
         if event.type in [EventType.TASK_FAILED, EventType.GATE_FAILED]:
@@ -157,10 +186,11 @@ class EventMetrics:
         return {
             "event_counts": self.counts,
             "average_durations": {
-                task: sum(times) / len(times) if times else 0
-                for task, times in self.durations.items()
+                task: total / count if count else 0
+                for task, (total, count) in self.duration_totals.items()
             },
             "error_rate": len(self.errors) / sum(self.counts.values()) if self.counts else 0,
+            "counters": dict(self.counters),
             "recent_errors": self.errors[-10:]  # Last 10 errors
         }
 
@@ -0,0 +1,90 @@
+"""
+Claude Squad 6 - Task Executors
+Pluggable backends that run role handlers inline or in a process pool
+"""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from . import runtime
+
+if TYPE_CHECKING:
+    from .orchestrator import ParallelOrchestrator, Task
+
+
+class TaskExecutor:
+    """Runs the role handler for a task and returns its result"""
+
+    async def run(self, orchestrator: "ParallelOrchestrator", task: "Task") -> Any:
+        raise NotImplementedError
+
+    async def run_batch(self, orchestrator: "ParallelOrchestrator", tasks: List["Task"]) -> List[Any]:
+        """Demultiplex a batched request: one result (or exception) per task, in order"""
+        return await asyncio.gather(*(self.run(orchestrator, task) for task in tasks), return_exceptions=True)
+
+    def shutdown(self) -> None:
+        """Release any resources held by the executor"""
+
+
+class InlineExecutor(TaskExecutor):
+    """Runs handlers on the orchestrator's own event loop (default)"""
+
+    async def run(self, orchestrator: "ParallelOrchestrator", task: "Task") -> Any:
+        return await orchestrator._execute_by_role(task)
+
+
+# Per-process orchestrator and event loop used by pool workers
+_worker_orchestrator = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker(factory: Optional[Callable[[], "ParallelOrchestrator"]] = None) -> None:
+    """Pool initializer: build the worker's orchestrator and the loop every task reuses"""
+    from .orchestrator import ParallelOrchestrator
+
+    global _worker_orchestrator, _worker_loop
+    _worker_orchestrator = (factory or ParallelOrchestrator)()
+    _worker_loop = runtime.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+def run_task_payload(payload: Dict[str, Any]) -> Any:
+    """Execute one task payload inside a worker process"""
+    from .orchestrator import Task
+
+    if _worker_loop is None:
+        _init_worker()  # Called outside a pool built by ProcessPoolTaskExecutor
+    task = Task.from_payload(payload)
+    return _worker_loop.run_until_complete(_worker_orchestrator._execute_by_role(task))
+
+
+class ProcessPoolTaskExecutor(TaskExecutor):
+    """Runs CPU-bound handlers in worker processes.
+
+    Tasks cross the process boundary as plain payload dicts, so params and
+    results must be picklable. Each worker builds its own orchestrator with
+    `factory` (a picklable, module-level callable) to look up handlers, and
+    one event loop that runs every task it receives.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, factory: Optional[Callable] = None):
+        self.max_workers = max_workers or os.cpu_count()
+        self.factory = factory
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.max_workers, initializer=_init_worker,
+                                             initargs=(self.factory,))
+        return self._pool
+
+    async def run(self, orchestrator: "ParallelOrchestrator", task: "Task") -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, run_task_payload, task.to_payload())
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
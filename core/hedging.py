@@ -0,0 +1,31 @@
+"""
+Claude Squad 6 - Hedged Execution
+Duplicate straggling handler calls, bounded by a global extra-work budget
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class HedgePolicy:
+    """Launch a backup attempt once a call outlives its role's observed latency quantile.
+
+    `budget` caps hedges as a fraction of all hedgeable calls (0.05 = at most
+    5% extra work); roles with fewer than `min_samples` recorded durations are
+    never hedged.
+    """
+
+    quantile: float = 0.95
+    budget: float = 0.05
+    min_samples: int = 20
+    calls: int = 0
+    hedges: int = 0
+
+    def record_call(self) -> None:
+        self.calls += 1
+
+    def try_acquire(self) -> bool:
+        """Reserve budget for one more hedge"""
+        if self.hedges + 1 > self.budget * self.calls:
+            return False
+        self.hedges += 1
+        return True
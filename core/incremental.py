@@ -0,0 +1,94 @@
+"""
+Claude Squad 6 - Incremental Re-execution
+Make-style per-task fingerprints so re-runs only execute what changed
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache import stable_hash
+
+
+class FingerprintStore:
+    """Persisted record of each task's inputs and output from the last run.
+
+    A task is up to date when its role, action, params, persona version and
+    the *outputs* of its dependencies all match the stored record; an upstream
+    task that re-ran but produced the same output does not invalidate it.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        if self.path.exists():
+            with open(self.path) as f:
+                self.records = json.load(f).get("tasks", {})
+
+    @staticmethod
+    def inputs(role: str, action: str, params: Dict[str, Any], persona_version: str,
+               upstream_outputs: Dict[str, str]) -> Dict[str, Any]:
+        """Fingerprintable description of what a task consumes"""
+        return {
+            "role": role,
+            "action": action,
+            "params": stable_hash(params),
+            "persona_version": persona_version,
+            "upstream": upstream_outputs
+        }
+
+    def explain(self, task_id: str, inputs: Dict[str, Any]) -> Optional[str]:
+        """Why the task must run, or None when its stored result is reusable"""
+        record = self.records.get(task_id)
+        if record is None:
+            return "no previous run"
+        if record.get("status") != "completed":
+            return "previous run did not complete"
+
+        previous = record["inputs"]
+        if (previous["role"], previous["action"]) != (inputs["role"], inputs["action"]):
+            return "role or action changed"
+        if previous["params"] != inputs["params"]:
+            return "params changed"
+        if previous["persona_version"] != inputs["persona_version"]:
+            return f"persona version changed ({previous['persona_version']} -> {inputs['persona_version']})"
+
+        before, now = previous["upstream"], inputs["upstream"]
+        for dep, output in now.items():
+            if dep not in before:
+                return f"new dependency '{dep}'"
+            if before[dep] != output:
+                return f"upstream '{dep}' output changed"
+        removed = set(before) - set(now)
+        if removed:
+            return f"dependency '{sorted(removed)[0]}' removed"
+        return None
+
+    def result(self, task_id: str) -> Any:
+        return self.records[task_id]["result"]
+
+    def output(self, task_id: str) -> Optional[str]:
+        record = self.records.get(task_id)
+        return record["output"] if record else None
+
+    def record(self, task_id: str, inputs: Dict[str, Any], status: str, result: Any = None) -> None:
+        """Remember a task's inputs and output for the next run"""
+        self.records[task_id] = {
+            "inputs": inputs,
+            "status": status,
+            "result": result,
+            "output": stable_hash(result)
+        }
+        self.dirty = True
+
+    def save(self) -> None:
+        """Atomically write the store if anything changed"""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"tasks": self.records}, f, default=str)
+        os.replace(tmp, self.path)
+        self.dirty = False
@@ -3,73 +3,319 @@ Claude Squad 6 - Parallel Orchestrator with TechLead
 Enhanced with 6-person team support and hooks integration
 """
 import asyncio
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import AsyncIterator, List, Dict, Any, Optional, Sequence, Tuple
 from enum import Enum
 import json
+import sys
+import time
+
+from .admission import AdmissionController, AdmissionRejected
+from .backends import RoleBackend, SleepBackend, backend_from_config
+from .batching import RoleBatcher
+from .cache import ResultCache, stable_hash, task_cache_key
+from .checkpoint import RunJournal
+from .context import TokenCounter
+from .events import EventMetrics, event_bus
+from .executors import TaskExecutor, InlineExecutor, ProcessPoolTaskExecutor
+from .hedging import HedgePolicy
+from .incremental import FingerprintStore
+from .personas import persona_text, persona_version
+from .pools import RolePools
+from .ratelimit import RateLimiter
+from .retry import RetryPolicies
+from .scheduler import DependencyGraph, ReadyQueue, task_durations
+from .singleflight import SingleFlight
 
 class TaskStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    SKIPPED = "skipped"      # Not run because a dependency did not complete
+    CANCELLED = "cancelled"  # Stopped mid-flight by fail-fast
+
+# Bound once: enum attribute lookups are measurable on million-task hot paths
+PENDING, RUNNING, COMPLETED, FAILED, SKIPPED, CANCELLED = (
+    TaskStatus.PENDING, TaskStatus.RUNNING, TaskStatus.COMPLETED,
+    TaskStatus.FAILED, TaskStatus.SKIPPED, TaskStatus.CANCELLED
+)
 
-@dataclass
 class Task:
-    id: str
-    role: str
-    action: str
-    dependencies: List[str] = None
-    params: Dict[str, Any] = None
-    status: TaskStatus = TaskStatus.PENDING
-    result: Any = None
-    error: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
-        if self.params is None:
-            self.params = {}
+    """A unit of work for one role.
+    
+    Slotted to keep million-task graphs small: role and action are interned,
+    dependencies are stored as a tuple, and the params/metadata dicts are only
+    allocated when first written.
+    """
+    __slots__ = ("id", "role", "action", "dependencies", "_params", "status",
+                 "result", "error", "attempts", "_metadata")
+    
+    def __init__(
+        self,
+        id: str,
+        role: str,
+        action: str,
+        dependencies: Optional[Sequence[str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        status: TaskStatus = PENDING,
+        result: Any = None,
+        error: Optional[str] = None,
+        attempts: int = 0,  # Handler attempts made (retries included)
+        metadata: Optional[Dict[str, Any]] = None  # e.g. {"duration": seconds} from workflow YAML
+    ):
+        self.id = id
+        self.role = sys.intern(role)
+        self.action = sys.intern(action)
+        self.dependencies: Tuple[str, ...] = tuple(dependencies) if dependencies else ()
+        self._params = params
+        self.status = status
+        self.result = result
+        self.error = error
+        self.attempts = attempts
+        self._metadata = metadata
+    
+    @property
+    def params(self) -> Dict[str, Any]:
+        if self._params is None:
+            self._params = {}
+        return self._params
+    
+    @params.setter
+    def params(self, value: Optional[Dict[str, Any]]) -> None:
+        self._params = value
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        self._metadata = value
+    
+    def meta(self, key: str, default: Any = None) -> Any:
+        """Read a metadata entry without allocating the dict"""
+        return self._metadata.get(key, default) if self._metadata else default
+    
+    def _fields(self) -> tuple:
+        return (self.id, self.role, self.action, self.dependencies, self.params, self.status,
+                self.result, self.error, self.attempts, self.metadata)
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    __hash__ = None  # Mutable, compared by value (as the former dataclass was)
+    
+    def __repr__(self) -> str:
+        return (f"Task(id={self.id!r}, role={self.role!r}, action={self.action!r}, "
+                f"dependencies={list(self.dependencies)!r}, status={self.status}, attempts={self.attempts})")
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Picklable task inputs for out-of-process execution"""
+        return {
+            "id": self.id,
+            "role": self.role,
+            "action": self.action,
+            "dependencies": list(self.dependencies),
+            "params": self._params,
+            "metadata": self._metadata
+        }
+    
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "Task":
+        """Rebuild a pending task from `to_payload` output"""
+        return cls(**payload)
+
+# A dependency in one of these states means the dependent cannot run
+BLOCKING_STATUSES = (FAILED, SKIPPED, CANCELLED)
+
+class ResultSynthesizer:
+    """Accumulates `synthesize_results` output one finished task at a time.
+    
+    With `keep_results=False` only the counters are kept, so a long stream can
+    be summarized without holding every result in memory.
+    """
+    
+    def __init__(self, keep_results: bool = True):
+        self.keep_results = keep_results
+        self.counts = {status: 0 for status in TaskStatus}
+        self.total = 0
+        self.by_role: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def add(self, task: Task) -> None:
+        self.total += 1
+        self.counts[task.status] += 1
+        if self.keep_results:
+            self.by_role.setdefault(task.role, []).append({
+                "action": task.action,
+                "status": task.status.value,
+                "result": task.result
+            })
+    
+    def synthesis(self) -> Dict[str, Any]:
+        return {
+            "summary": {},
+            "by_role": self.by_role,
+            "metrics": {
+                "total_tasks": self.total,
+                "completed": self.counts[COMPLETED],
+                "failed": self.counts[FAILED],
+                "skipped": self.counts[SKIPPED],
+                "cancelled": self.counts[CANCELLED]
+            }
+        }
 
 class ParallelOrchestrator:
     """Orchestrates parallel execution of tasks across 6-person team"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        dataflow: bool = False,
+        max_concurrency: Optional[int] = None,
+        role_limits: Optional[Dict[str, int]] = None,
+        pools: Optional[RolePools] = None,
+        cache: Optional[ResultCache] = None,
+        metrics: Optional[EventMetrics] = None,
+        incremental: Optional[FingerprintStore] = None,
+        journal: Optional[RunJournal] = None,
+        fail_fast: bool = False,
+        policies: Optional[RetryPolicies] = None,
+        hedging: Optional[HedgePolicy] = None,
+        singleflight: Optional[SingleFlight] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        batch_window: Optional[float] = None,
+        max_batch: int = 8,
+        run_id: Optional[str] = None,
+        admission: Optional[AdmissionController] = None,
+        backend: Optional[RoleBackend] = None
+    ):
+        self.run_id = run_id  # Tenant for fair sharing when pools are shared between runs
+        self.admission = admission  # Backpressure: bounded in-flight and queued tasks
         self.tasks: Dict[str, Task] = {}
         self.event_handlers = []
         self.hooks_runner = None  # Will be set by CLI
+        self.dataflow = dataflow  # Start tasks as soon as their own dependencies finish
+        self.fail_fast = fail_fast  # Cancel in-flight work on the first failure
+        self.policies = policies or RetryPolicies()  # Timeouts and retries per role/action
+        # Roles whose handlers run hooks and checks against live repo state: never
+        # hedged, batched, cached, coalesced or reused from a previous run
+        self.side_effect_roles = {"tech_lead"}
+        # Opt-in duplicate attempts for stragglers
+        self.hedging = hedging
+        # Shared model API quota; pass one limiter to every orchestrator in a process
+        self.rate_limiter = rate_limiter
+        self.token_counter = TokenCounter()
+        # The model call behind every handler attempt (or batch of them)
+        self.backend = backend or SleepBackend()
+        # Same-role tasks ready within `batch_window` seconds share one model call
+        self.batcher = RoleBatcher(self._flush_batch, batch_window, max_batch) \
+            if batch_window is not None else None
+        # Per-role worker pools; unbounded unless limits are given
+        self.pools = pools or RolePools(role_limits, global_limit=max_concurrency)
+        # Handler executors keyed by (role, action); None matches any
+        self.executors: Dict[Tuple[Optional[str], Optional[str]], TaskExecutor] = {}
+        self.default_executor: TaskExecutor = InlineExecutor()
+        # Result memoization and in-flight coalescing
+        self.cache = cache
+        self.singleflight = singleflight or SingleFlight()
+        # Finished tasks by ID, for upstream results; dropped once no task of the graph reads them
+        self.completed: Dict[str, Task] = {}
+        self.incremental = incremental  # Per-task fingerprints from the previous run
+        self.journal = journal  # Checkpoints for crash recovery / resume
+        self.metrics = metrics or event_bus.metrics
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], **kwargs) -> "ParallelOrchestrator":
+        """Create an orchestrator using the `team` section of claude.yaml"""
+        pools = RolePools.from_team_config(
+            config.get("team") or {},
+            global_limit=kwargs.pop("max_concurrency", None)
+        )
+        if "admission" not in kwargs:
+            kwargs["admission"] = AdmissionController.from_config(config.get("admission") or {})
+        if "backend" not in kwargs and config.get("backend"):
+            kwargs["backend"] = backend_from_config(config["backend"])
+        if "rate_limiter" not in kwargs:
+            kwargs["rate_limiter"] = RateLimiter.from_config(config.get("rate_limits") or {})
+        
+        hedge_config = config.get("hedging") or {}
+        if hedge_config.get("enabled") and "hedging" not in kwargs:
+            kwargs["hedging"] = HedgePolicy(
+                quantile=hedge_config.get("quantile", 0.95),
+                budget=hedge_config.get("budget", 0.05),
+                min_samples=hedge_config.get("min_samples", 20)
+            )
+        
+        batch_config = config.get("batching") or {}
+        if batch_config.get("enabled") and "batch_window" not in kwargs:
+            kwargs["batch_window"] = batch_config.get("window_ms", 20) / 1000
+            kwargs["max_batch"] = batch_config.get("max_batch", 8)
+        
+        cache_config = config.get("cache") or {}
+        if cache_config.get("enabled") and "cache" not in kwargs:
+            kwargs["cache"] = ResultCache(
+                directory=cache_config.get("directory", ".claude-squad/cache"),
+                max_entries=cache_config.get("memory_entries", 1024),
+                max_disk_bytes=int(cache_config.get("max_disk_mb", 256) * 1024 * 1024)
+            )
+        orchestrator = cls(pools=pools, **kwargs)
+        
+        execution = config.get("execution") or {}
+        roles = execution.get("process_roles") or []
+        actions = execution.get("process_actions") or []
+        if roles or actions:
+            process_pool = ProcessPoolTaskExecutor(execution.get("process_workers") or None)
+            for role in roles:
+                orchestrator.set_executor(process_pool, role=role)
+            for action in actions:
+                orchestrator.set_executor(process_pool, action=action)
+        return orchestrator
+    
+    def set_executor(self, executor: TaskExecutor, role: Optional[str] = None,
+                     action: Optional[str] = None) -> None:
+        """Route handlers for a role, an action, or a role/action pair to an executor"""
+        if role is None and action is None:
+            self.default_executor = executor
+        else:
+            self.executors[(role, action)] = executor
+    
+    def executor_for(self, task: Task) -> TaskExecutor:
+        """Most specific executor: role+action, then action, then role, then default"""
+        for key in ((task.role, task.action), (None, task.action), (task.role, None)):
+            executor = self.executors.get(key)
+            if executor is not None:
+                return executor
+        return self.default_executor
+    
+    def shutdown(self) -> None:
+        """Shut down executors (e.g. process pools) and the model backend"""
+        for executor in {id(e): e for e in [self.default_executor, *self.executors.values()]}.values():
+            executor.shutdown()
+        self.backend.shutdown()
         
     def add_task(self, task: Task) -> None:
         """Add a task to the execution queue"""
+        max_queued = self.admission.max_queued if self.admission is not None else None
+        if max_queued is not None and len(self.tasks) >= max_queued and task.id not in self.tasks:
+            # Finished tasks have left the queue; prune them only when the limit is reached
+            self.tasks = {task_id: queued for task_id, queued in self.tasks.items()
+                          if queued.status in (PENDING, RUNNING)}
+            if len(self.tasks) >= max_queued:
+                self.metrics.increment("admission.rejected")
+                raise AdmissionRejected(f"Task queue full ({len(self.tasks)} unfinished tasks)")
         self.tasks[task.id] = task
         self._emit_event("task.added", task)
         
     def calculate_waves(self, tasks: List[Task]) -> List[List[Task]]:
-        """Group tasks into waves based on dependencies"""
-        waves = []
-        completed_ids = set()
-        remaining_tasks = tasks.copy()
-        
-        while remaining_tasks:
-            wave = []
-            for task in remaining_tasks:
-                # Task can run if all dependencies are completed
-                if all(dep in completed_ids for dep in task.dependencies):
-                    wave.append(task)
-            
-            if not wave:
-                # Circular dependency or impossible state
-                raise ValueError("Circular dependency detected")
-                
-            waves.append(wave)
-            completed_ids.update(task.id for task in wave)
-            remaining_tasks = [t for t in remaining_tasks if t not in wave]
-            
-        return waves
+        """Group tasks into waves based on dependencies (O(V+E))"""
+        return DependencyGraph(tasks).waves()
     
     async def execute_task(self, task: Task) -> Task:
         """Execute a single task"""
-        task.status = TaskStatus.RUNNING
+        task.status = RUNNING
         self._emit_event("task.started", task)
         
         try:
@@ -78,26 +324,212 @@ class ParallelOrchestrator:
                 hook_result = await self.hooks_runner.run_hooks(task.action)
                 if not hook_result['success']:
                     task.error = f"Hook failed: {hook_result['error']}"
-                    task.status = TaskStatus.FAILED
+                    task.status = FAILED
                     return task
             
-            # Simulate task execution (in real impl, would call Claude API)
-            await asyncio.sleep(0.1)  # Placeholder
+            # Tasks checkpointed by an interrupted run are restored, not re-executed
+            checkpoint = self.journal.completed(task.id) if self.journal else None
+            if checkpoint:
+                task.result = checkpoint["result"]
+                task.status = COMPLETED
+                task.metadata["resumed"] = True
+                self.completed[task.id] = task
+                self._emit_event("task.resumed", task)
+                return task
             
-            # Task-specific logic based on role and action
-            result = await self._execute_by_role(task)
+            # Unchanged tasks reuse the previous run's result
+            inputs = self._incremental_inputs(task)
+            reason = self.incremental.explain(task.id, inputs) if inputs else None
+            if inputs and reason is None:
+                task.result = self.incremental.result(task.id)
+                task.status = COMPLETED
+                task.metadata["reused"] = True
+                self.completed[task.id] = task
+                self._checkpoint(task)
+                self._emit_event("task.reused", task)
+                return task
+            if reason:
+                task.metadata["rerun_reason"] = reason
+            
+            # Identical inputs (role, action, params, upstream results) reuse a cached result
+            content_key = self._content_key(task)
+            cache_key = content_key if self.cache is not None else None
+            hit, result = self.cache.lookup(cache_key) if cache_key else (False, None)
+            if hit:
+                task.metadata["cached"] = True
+                self.metrics.increment("cache.hits")
+                self._emit_event("cache.hit", task)
+            else:
+                if cache_key:
+                    self.metrics.increment("cache.misses")
+                
+                result = await self._execute_coalesced(task, content_key)
+                
+                if cache_key:
+                    self.cache.put(cache_key, result)
             
             task.result = result
-            task.status = TaskStatus.COMPLETED
+            task.status = COMPLETED
+            self.completed[task.id] = task
+            if inputs:
+                self.incremental.record(task.id, inputs, task.status.value, result)
+            self._checkpoint(task)
             self._emit_event("task.completed", task)
             
+        except asyncio.CancelledError:
+            task.status = CANCELLED
+            task.error = "Cancelled"
+            self._emit_event("task.cancelled", task)
+            raise
+            
         except Exception as e:
             task.error = str(e)
-            task.status = TaskStatus.FAILED
+            task.status = FAILED
+            inputs = self._incremental_inputs(task)
+            if inputs:
+                self.incremental.record(task.id, inputs, task.status.value)
+            self._checkpoint(task)
             self._emit_event("task.failed", task, error=str(e))
             
         return task
     
+    async def _execute_with_policy(self, task: Task) -> Any:
+        """Run the handler under the task's timeout, retrying with jittered backoff"""
+        policy = self.policies.for_task(task.role, task.action, task.meta("policy"))
+        while True:
+            task.attempts += 1
+            started = time.monotonic()
+            try:
+                result = await asyncio.wait_for(self._hedged_call(task), policy.timeout)
+                self.metrics.record_duration(task.role, time.monotonic() - started)
+                return result
+            except asyncio.TimeoutError:
+                error: Exception = TimeoutError(f"Timed out after {policy.timeout:g}s")
+            except Exception as e:
+                error = e
+            
+            if task.attempts >= policy.max_attempts:
+                raise error
+            delay = policy.delay(task.attempts)
+            self._emit_event("task.retry", task, attempt=task.attempts, delay=delay, error=str(error))
+            await asyncio.sleep(delay)
+    
+    async def _hedged_call(self, task: Task) -> Any:
+        """Call the handler; if it outlives the role's p95, race a duplicate against it"""
+        hedge = self.hedging
+        if hedge is None or task.role in self.side_effect_roles:
+            return await self._call_handler(task)
+        
+        hedge.record_call()
+        delay = None
+        if self.metrics.sample_count(task.role) >= hedge.min_samples:
+            delay = self.metrics.percentile(task.role, hedge.quantile)
+        if delay is None:
+            return await self._call_handler(task)
+        
+        attempts = [asyncio.ensure_future(self._call_handler(task))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and hedge.try_acquire():
+                attempts.append(asyncio.ensure_future(self._call_handler(task)))
+                self.metrics.increment("hedge.launched")
+                self._emit_event("task.hedged", task, after=delay)
+            
+            # First successful attempt wins; fail only if every attempt failed
+            pending = set(attempts)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is not attempts[0]:
+                            self.metrics.increment("hedge.won")
+                        return future.result()
+                    error = error or future.exception()
+            raise error
+        finally:
+            for future in attempts:
+                future.cancel()
+    
+    async def _call_handler(self, task: Task) -> Any:
+        """One handler attempt"""
+        if self.batcher is not None and task.role not in self.side_effect_roles:
+            return await self.batcher.submit((task.role, self.executor_for(task)), task)
+        
+        await self._model_call(task.role, self._estimate_tokens(task))
+        
+        # Task-specific logic based on role and action
+        return await self.executor_for(task).run(self, task)
+    
+    async def _model_call(self, role: str, tokens: int, batch_size: int = 1) -> None:
+        """Every attempt is a model call: queue for request and token quota first"""
+        if self.rate_limiter is not None:
+            waited = await self.rate_limiter.acquire(tokens)
+            if waited:
+                self.metrics.record_duration("rate_limit.wait", waited)
+        
+        response = await self.backend.call(role, tokens, batch_size)
+        self.metrics.increment("model.calls")
+        self.metrics.increment("model.input_tokens", response.input_tokens)
+        self.metrics.increment("model.output_tokens", response.output_tokens)
+    
+    async def _flush_batch(self, key: Tuple[str, TaskExecutor], tasks: List[Task]) -> List[Any]:
+        """Send a role's batch as one request; the persona prompt is paid once, not per task"""
+        role, executor = key
+        tokens = sum(self._estimate_tokens(task) for task in tasks)
+        saved = self.token_counter.count(persona_text(role)) * (len(tasks) - 1)
+        await self._model_call(role, tokens - saved, len(tasks))
+        
+        self.metrics.increment("batch.calls")
+        self.metrics.increment("batch.tasks", len(tasks))
+        self.metrics.increment("batch.tokens_saved", saved)
+        self._emit_event("batch.executed", role=role, size=len(tasks), tokens_saved=saved)
+        return await executor.run_batch(self, tasks)
+    
+    def _estimate_tokens(self, task: Task) -> int:
+        """Prompt size estimate: persona, params and upstream results"""
+        upstream = {dep: self.completed[dep].result for dep in task.dependencies if dep in self.completed}
+        prompt = json.dumps({"params": task.params, "upstream": upstream}, default=str)
+        return self.token_counter.count(persona_text(task.role)) + self.token_counter.count(prompt)
+    
+    def _checkpoint(self, task: Task) -> None:
+        """Append the task's outcome to the run journal, if any"""
+        if self.journal is not None:
+            self.journal.record_task(task.id, task.status.value, task.result, task.error)
+    
+    def _incremental_inputs(self, task: Task) -> Optional[Dict[str, Any]]:
+        """Inputs fingerprint for incremental re-runs (None when disabled or never reusable)"""
+        if self.incremental is None or task.role in self.side_effect_roles:
+            return None
+        upstream = {}
+        for dep in task.dependencies:
+            if dep in self.completed:
+                upstream[dep] = stable_hash(self.completed[dep].result)
+            else:
+                upstream[dep] = self.incremental.output(dep)
+        return FingerprintStore.inputs(task.role, task.action, task.params,
+                                       persona_version(task.role), upstream)
+    
+    async def _execute_coalesced(self, task: Task, content_key: Optional[str]) -> Any:
+        """Share one execution between identical tasks that are in flight at the same time"""
+        if content_key is None or self.singleflight is None:
+            return await self._execute_with_policy(task)
+        if self.singleflight.in_flight(content_key):
+            task.metadata["coalesced"] = True
+            self.metrics.increment("singleflight.coalesced")
+            self._emit_event("task.coalesced", task)
+        return await self.singleflight.do(content_key, lambda: self._execute_with_policy(task))
+    
+    def _content_key(self, task: Task) -> Optional[str]:
+        """Content address of a task's inputs, or None when it must not be shared"""
+        if task.role in self.side_effect_roles:
+            return None
+        upstream = [
+            (dep, self.completed[dep].result if dep in self.completed else None)
+            for dep in task.dependencies
+        ]
+        return task_cache_key(task.role, task.action, task.params, upstream, persona_version(task.role))
+    
     async def _execute_by_role(self, task: Task) -> Any:
         """Execute task based on role (simplified for demo)"""
         role_handlers = {
@@ -203,46 +635,289 @@ class ParallelOrchestrator:
     
     async def execute_wave(self, tasks: List[Task]) -> List[Task]:
         """Execute all tasks in a wave in parallel"""
-        waves = self.calculate_waves(tasks)
-        all_results = []
+        if self.dataflow:
+            return await self.execute_dataflow(tasks)
+        
+        graph = DependencyGraph(tasks)
+        waves = graph.waves()
+        priorities = self._priorities(graph)
+        readers = [len(dependents) for dependents in graph.dependents]
+        aborted = False
         
-        for i, wave in enumerate(waves):
-            self._emit_event("wave.started", wave_number=i+1, tasks=len(wave))
+        try:
+            for i, wave in enumerate(waves):
+                if aborted:
+                    for task in wave:
+                        self._skip(task, "fail-fast abort")
+                    continue
+                
+                self._emit_event("wave.started", wave_number=i+1, tasks=len(wave))
+                
+                # Dependents of failed tasks are skipped instead of running on missing inputs
+                runnable = [task for task in wave if not self._skip_if_blocked(graph, task)]
+                
+                # Execute all tasks in this wave in parallel, within the role pools
+                running = [self._schedule(task, priorities[graph.index[task.id]]) for task in runnable]
+                if self.fail_fast:
+                    def cancel_siblings(future: asyncio.Future) -> None:
+                        nonlocal aborted
+                        if not future.cancelled() and not future.exception() and \
+                                future.result().status == FAILED and not aborted:
+                            aborted = True
+                            for sibling in running:
+                                sibling.cancel()
+                    
+                    for future in running:
+                        future.add_done_callback(cancel_siblings)
+                
+                await asyncio.gather(*running, return_exceptions=True)
+                for task in wave:
+                    self._forget_upstream(graph, readers, graph.index[task.id])
+                self._emit_event("wave.completed", wave_number=i+1)
+        finally:
+            self._forget_graph(graph)
+        
+        if self.incremental is not None:
+            self.incremental.save()
+        return [task for wave in waves for task in wave]
+    
+    async def execute_dataflow(self, tasks: List[Task]) -> List[Task]:
+        """Execute tasks without wave barriers: each starts once its own dependencies finish"""
+        graph = DependencyGraph(tasks)
+        waves = graph.waves()  # Reporting only; execution is driven by the ready queue
+        self._emit_event("dataflow.started", tasks=len(tasks), waves=len(waves))
+        
+        if tasks:
+            loop = asyncio.get_running_loop()
+            finished = loop.create_future()
+            priorities = self._priorities(graph)
+            ready = ReadyQueue(graph)
+            outstanding: Dict[int, asyncio.Future] = {}
+            readers = [len(dependents) for dependents in graph.dependents]
+            pending = len(tasks)
+            aborted = False
             
-            # Execute all tasks in this wave in parallel
-            wave_results = await asyncio.gather(
-                *[self.execute_task(task) for task in wave],
-                return_exceptions=True
-            )
+            def settle(index: int) -> None:
+                nonlocal pending
+                pending -= 1
+                self._forget_upstream(graph, readers, index)
+                if not aborted:
+                    ready.complete(index)
+            
+            def launch() -> None:
+                while ready and not aborted:
+                    index = ready.pop()
+                    if self._skip_if_blocked(graph, graph.tasks[index]):
+                        settle(index)
+                        continue
+                    future = self._schedule(graph.tasks[index], priorities[index])
+                    outstanding[index] = future
+                    future.add_done_callback(lambda f, i=index: on_done(f, i))
             
-            all_results.extend(wave_results)
-            self._emit_event("wave.completed", wave_number=i+1)
+            def abort() -> None:
+                # Structured cancellation: stop in-flight work, never start the rest
+                nonlocal aborted
+                aborted = True
+                for future in list(outstanding.values()):
+                    future.cancel()
+                for task in graph.tasks:
+                    if task.status == PENDING:
+                        self._skip(task, "fail-fast abort")
             
-        return all_results
+            def on_done(future: asyncio.Future, index: int) -> None:
+                outstanding.pop(index, None)
+                if not future.cancelled() and future.exception():
+                    if not finished.done():
+                        finished.set_exception(future.exception())
+                    return
+                if self.fail_fast and not aborted and graph.tasks[index].status == FAILED:
+                    abort()
+                settle(index)
+                launch()
+                if not finished.done() and (pending == 0 or (aborted and not outstanding)):
+                    finished.set_result(None)
+            
+            launch()
+            if pending == 0 and not finished.done():
+                finished.set_result(None)
+            try:
+                await finished
+            except asyncio.CancelledError:
+                # Cancelled from outside: stop in-flight tasks and launch nothing new
+                aborted = True
+                running = list(outstanding.values())
+                for future in running:
+                    future.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                raise
+            finally:
+                self._forget_graph(graph)
+        
+        if self.incremental is not None:
+            self.incremental.save()
+        self._emit_event("dataflow.completed", tasks=len(tasks))
+        return [task for wave in waves for task in wave]
+    
+    async def stream(self, tasks: List[Task]) -> AsyncIterator[Task]:
+        """Execute tasks like `execute_wave`, yielding each one as it finishes.
+        
+        Tasks arrive in completion order, including skipped and cancelled ones,
+        so every task is yielded exactly once. Closing the iterator early
+        cancels running tasks and marks the ones that never started SKIPPED.
+        """
+        finished: asyncio.Queue = asyncio.Queue()
+        members = {id(task) for task in tasks}
+        
+        def collect(event: Dict[str, Any]) -> None:
+            if event["type"] == "task.finished" and id(event["data"]["args"][0]) in members:
+                finished.put_nowait(event["data"]["args"][0])
+        
+        self.on_event(collect)
+        runner = asyncio.ensure_future(self.execute_wave(tasks))
+        runner.add_done_callback(lambda _: finished.put_nowait(None))
+        try:
+            while True:
+                task = await finished.get()
+                if task is None:
+                    break
+                yield task
+            await runner  # Surface scheduler errors
+        finally:
+            self.event_handlers.remove(collect)
+            if not runner.done():
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+                for task in tasks:
+                    self._skip(task, "stream closed")
+    
+    async def submit(self, task: Task, wait: bool = True) -> "asyncio.Future[Task]":
+        """Admit one independent task and start it; returns a future for the finished task.
+        
+        Blocks while the admission controller is at its in-flight limit, and
+        raises AdmissionRejected when its queue is full (or `wait=False`).
+        Dependencies are not awaited; use `execute_wave` or `stream` for graphs.
+        """
+        if self.admission is not None:
+            await self._admit(task, wait=wait, reject=True)
+        return self._schedule(task, admitted=True)
+    
+    async def _admit(self, task: Task, wait: bool = True, reject: bool = False) -> None:
+        try:
+            waited = await self.admission.admit(wait=wait, reject=reject)
+        except AdmissionRejected:
+            self.metrics.increment("admission.rejected")
+            raise
+        if waited:
+            self.metrics.record_duration("admission.wait", waited)
+            self._emit_event("task.admitted", task, waited=waited, queued=self.admission.queued)
+    
+    def _schedule(self, task: Task, priority: float = 0.0, admitted: bool = False) -> asyncio.Task:
+        """Queue a task on its role pool; the returned asyncio task resolves once it has executed.
+        
+        With admission control, the task first waits for an in-flight slot
+        (never rejected: its graph was already accepted) unless the caller
+        `admitted` it. Cancelling it before it starts executing withdraws it
+        from its pool and marks it SKIPPED; cancelling it while running marks
+        it CANCELLED.
+        """
+        slot = asyncio.get_running_loop().create_future()
+        admission = self.admission
+        holds_admission = admission is not None and admitted
+        handle = None  # Pool entry while queued
+        dispatched = executing = False
+        
+        def start() -> None:
+            nonlocal dispatched
+            dispatched = True
+            if slot.cancelled():
+                self.pools.release(task.role)  # Cancelled while queued: hand the slot back
+            else:
+                slot.set_result(None)
+        
+        async def run() -> Task:
+            nonlocal holds_admission, handle, executing
+            if admission is not None and not holds_admission:
+                await self._admit(task)
+                holds_admission = True
+                handle = self.pools.submit(task.role, start, priority, tenant=self.run_id)
+            await slot
+            executing = True
+            try:
+                return await self.execute_task(task)
+            finally:
+                self.pools.release(task.role)
+                if holds_admission:
+                    admission.release()
+                self._emit_event("task.finished", task)
+        
+        def cancelled_before_start(future: asyncio.Future) -> None:
+            # A done callback, so it also covers a task cancelled before its first step
+            if executing or not future.cancelled():
+                return
+            # Cancelling run() while it awaits the slot also cancels the slot, so
+            # whether the pool already dispatched the entry decides what to undo
+            if not dispatched:
+                slot.cancel()
+                if handle is not None:
+                    self.pools.withdraw(task.role, handle, tenant=self.run_id)
+            elif not slot.cancelled():
+                self.pools.release(task.role)  # Slot granted just before the cancel landed
+            if holds_admission:
+                admission.release()
+            self._skip(task, "cancelled before start")
+        
+        future = asyncio.ensure_future(run())
+        future.add_done_callback(cancelled_before_start)
+        if admission is None or admitted:
+            handle = self.pools.submit(task.role, start, priority, tenant=self.run_id)
+        return future
+    
+    def _forget_upstream(self, graph: DependencyGraph, readers: List[int], index: int) -> None:
+        """A task settled: drop results that no unsettled task of the graph still reads"""
+        if not readers[index]:
+            self.completed.pop(graph.tasks[index].id, None)
+        for dep in graph.tasks[index].dependencies:
+            j = graph.index[dep]
+            readers[j] -= 1
+            if not readers[j]:
+                self.completed.pop(dep, None)
+    
+    def _forget_graph(self, graph: DependencyGraph) -> None:
+        """The graph run ended (possibly aborted): none of its results are needed any more"""
+        for task in graph.tasks:
+            self.completed.pop(task.id, None)
+    
+    def _skip_if_blocked(self, graph: DependencyGraph, task: Task) -> bool:
+        """Skip a task whose dependency failed, was skipped or was cancelled"""
+        for dep in task.dependencies:
+            if graph.tasks[graph.index[dep]].status in BLOCKING_STATUSES:
+                self._skip(task, f"dependency '{dep}' {graph.tasks[graph.index[dep]].status.value}")
+                return True
+        return False
+    
+    def _skip(self, task: Task, reason: str) -> None:
+        if task.status == PENDING:
+            task.status = SKIPPED
+            task.error = f"Skipped: {reason}"
+            self._emit_event("task.skipped", task, reason=reason)
+            self._emit_event("task.finished", task)
+    
+    def _priorities(self, graph: DependencyGraph) -> List[float]:
+        """Critical-path priority per task; only worth computing when slots are limited"""
+        if not self.pools.bounded:
+            return [0.0] * len(graph)
+        return graph.critical_path(task_durations(graph.tasks))
+    
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth and utilization per role pool"""
+        return self.pools.stats()
     
     def synthesize_results(self, results: List[Task]) -> Dict[str, Any]:
         """Synthesize results from all tasks"""
-        synthesis = {
-            "summary": {},
-            "by_role": {},
-            "metrics": {
-                "total_tasks": len(results),
-                "completed": sum(1 for r in results if r.status == TaskStatus.COMPLETED),
-                "failed": sum(1 for r in results if r.status == TaskStatus.FAILED)
-            }
-        }
-        
+        synthesizer = ResultSynthesizer()
         for task in results:
-            role = task.role
-            if role not in synthesis["by_role"]:
-                synthesis["by_role"][role] = []
-            synthesis["by_role"][role].append({
-                "action": task.action,
-                "status": task.status.value,
-                "result": task.result
-            })
-        
-        return synthesis
+            synthesizer.add(task)
+        return synthesizer.synthesis()
     
     def _emit_event(self, event_type: str, *args, **kwargs):
         """Emit an event for observability"""
@@ -0,0 +1,29 @@
+"""
+Claude Squad 6 - Persona Registry
+Loads personas/*.yaml once and exposes their versions and prompt text
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any
+
+import yaml
+
+PERSONAS_DIR = Path(__file__).parent.parent / "personas"
+
+
+@lru_cache(maxsize=None)
+def persona_text(role: str) -> str:
+    """Raw persona definition (the prompt overhead a role pays per call)"""
+    path = PERSONAS_DIR / f"{role}.yaml"
+    return path.read_text() if path.exists() else ""
+
+
+@lru_cache(maxsize=None)
+def load_persona(role: str) -> Dict[str, Any]:
+    """Parsed persona definition, empty for unknown roles"""
+    return yaml.safe_load(persona_text(role)) or {}
+
+
+def persona_version(role: str) -> str:
+    """Declared persona version, used to invalidate cached results"""
+    return str(load_persona(role).get("version", "0"))
@@ -0,0 +1,244 @@
+"""
+Claude Squad 6 - Execution Plans
+Compiles workflows/*.yaml into immutable plans cached on disk by content hash
+"""
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from .orchestrator import Task
+from .retry import RetryPolicies, RetryPolicy
+from .scheduler import DependencyGraph, task_durations
+from .validation import ValidationResult, validate_graph
+from .workflow import build_task, load_policies, parse_duration, stage_task_configs
+
+# Bump when the plan layout changes so stale cache files are recompiled
+PLAN_FORMAT = 2
+
+
+class TaskSpec(NamedTuple):
+    """Immutable task template; `Task` objects are created per run"""
+    id: str
+    role: str
+    action: str
+    dependencies: Tuple[str, ...]
+    duration: Optional[float]
+    policy: Tuple[Tuple[str, Any], ...]
+
+    def task(self, params: Optional[Dict[str, Any]] = None) -> Task:
+        metadata: Dict[str, Any] = {}
+        if self.duration is not None:
+            metadata["duration"] = self.duration
+        if self.policy:
+            metadata["policy"] = dict(self.policy)
+        return Task(self.id, self.role, self.action, self.dependencies, dict(params or {}), metadata=metadata)
+
+
+@dataclass(frozen=True)
+class RoleDemand:
+    tasks: int
+    work_seconds: float  # Sum of task durations
+    peak_parallel: int   # Most tasks of the role in a single level
+
+
+@dataclass(frozen=True)
+class StagePlan:
+    key: str
+    name: str
+    duration: Optional[float]
+    tasks: Tuple[TaskSpec, ...]  # Flattened DAG in workflow order
+    levels: Tuple[int, ...]      # Wave number per task
+    critical_path: Tuple[str, ...]
+    critical_seconds: float
+    role_demands: Tuple[Tuple[str, RoleDemand], ...]
+    validation: ValidationResult
+
+    def instantiate(self, description: str) -> List[Task]:
+        """Fresh Task objects for one run of this stage"""
+        return [spec.task({"description": description}) for spec in self.tasks]
+
+    def waves(self) -> List[List[TaskSpec]]:
+        waves: List[List[TaskSpec]] = [[] for _ in range(max(self.levels, default=-1) + 1)]
+        for spec, level in zip(self.tasks, self.levels):
+            waves[level].append(spec)
+        return waves
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    name: str
+    source_hash: str
+    duration: Optional[str]
+    policies: RetryPolicies
+    stages: Tuple[StagePlan, ...]
+
+    @property
+    def ok(self) -> bool:
+        return all(stage.validation.ok for stage in self.stages)
+
+
+def _compile_stage(key: str, stage: Dict[str, Any]) -> StagePlan:
+    specs = []
+    for config in stage_task_configs(stage):
+        task = build_task(config)
+        specs.append(TaskSpec(
+            task.id, task.role, task.action, task.dependencies,
+            task.meta("duration"), tuple(sorted((task.meta("policy") or {}).items()))
+        ))
+    tasks = [spec.task() for spec in specs]
+
+    validation = validate_graph(tasks)
+    if not validation.ok:
+        # Keep the diagnosis; there is nothing to schedule
+        return StagePlan(key, stage.get("name", key), parse_duration(stage.get("duration")), tuple(specs),
+                         (), (), 0.0, (), validation)
+
+    graph = DependencyGraph(tasks)
+    levels = graph.levels()
+    durations = task_durations(tasks)
+    remaining = graph.critical_path(durations)
+
+    # Walk the longest path from its root, always into the longest remaining dependent
+    path: List[str] = []
+    if tasks:
+        index = max((i for i, task in enumerate(tasks) if not task.dependencies), key=remaining.__getitem__)
+        while True:
+            path.append(tasks[index].id)
+            if not graph.dependents[index]:
+                break
+            index = max(graph.dependents[index], key=remaining.__getitem__)
+
+    demands: Dict[str, List[Any]] = {}
+    per_level: Dict[Tuple[str, int], int] = {}
+    for task, level, duration in zip(tasks, levels, durations):
+        demand = demands.setdefault(task.role, [0, 0.0, 0])
+        demand[0] += 1
+        demand[1] += duration
+        per_level[(task.role, level)] = per_level.get((task.role, level), 0) + 1
+        demand[2] = max(demand[2], per_level[(task.role, level)])
+
+    return StagePlan(
+        key=key,
+        name=stage.get("name", key),
+        duration=parse_duration(stage.get("duration")),
+        tasks=tuple(specs),
+        levels=tuple(levels),
+        critical_path=tuple(path),
+        critical_seconds=max(remaining, default=0.0),
+        role_demands=tuple((role, RoleDemand(*demand)) for role, demand in sorted(demands.items())),
+        validation=validation
+    )
+
+
+def compile_workflow(config: Dict[str, Any], source_hash: str = "") -> ExecutionPlan:
+    """Turn a parsed workflow YAML into an ExecutionPlan"""
+    return ExecutionPlan(
+        name=config.get("name", ""),
+        source_hash=source_hash,
+        duration=config.get("duration"),
+        policies=load_policies(config),
+        stages=tuple(_compile_stage(key, stage) for key, stage in (config.get("stages") or {}).items())
+    )
+
+
+def _plan_to_json(plan: ExecutionPlan) -> Dict[str, Any]:
+    return {
+        "format": PLAN_FORMAT,
+        "name": plan.name,
+        "source_hash": plan.source_hash,
+        "duration": plan.duration,
+        "policies": {
+            "default": asdict(plan.policies.default),
+            "roles": plan.policies.roles,
+            "actions": plan.policies.actions
+        },
+        "stages": [
+            {
+                "key": stage.key,
+                "name": stage.name,
+                "duration": stage.duration,
+                "tasks": stage.tasks,
+                "levels": stage.levels,
+                "critical_path": stage.critical_path,
+                "critical_seconds": stage.critical_seconds,
+                "role_demands": [(role, asdict(demand)) for role, demand in stage.role_demands],
+                "validation": asdict(stage.validation)
+            }
+            for stage in plan.stages
+        ]
+    }
+
+
+def _stage_from_json(data: Dict[str, Any]) -> StagePlan:
+    validation = data["validation"]
+    return StagePlan(
+        key=data["key"],
+        name=data["name"],
+        duration=data["duration"],
+        tasks=tuple(
+            TaskSpec(task_id, role, action, tuple(dependencies), duration, tuple(tuple(item) for item in policy))
+            for task_id, role, action, dependencies, duration, policy in data["tasks"]
+        ),
+        levels=tuple(data["levels"]),
+        critical_path=tuple(data["critical_path"]),
+        critical_seconds=data["critical_seconds"],
+        role_demands=tuple((role, RoleDemand(**demand)) for role, demand in data["role_demands"]),
+        validation=ValidationResult(
+            signature=validation["signature"],
+            duplicates=tuple(validation["duplicates"]),
+            missing=tuple((task_id, dep, tuple(hints)) for task_id, dep, hints in validation["missing"]),
+            cycles=tuple(tuple(cycle) for cycle in validation["cycles"]),
+            components=tuple(tuple(component) for component in validation["components"])
+        )
+    )
+
+
+def _plan_from_json(data: Dict[str, Any]) -> ExecutionPlan:
+    if data.get("format") != PLAN_FORMAT:
+        raise ValueError(f"Unsupported plan format {data.get('format')!r}")
+    policies = data["policies"]
+    return ExecutionPlan(
+        name=data["name"],
+        source_hash=data["source_hash"],
+        duration=data["duration"],
+        policies=RetryPolicies(RetryPolicy(**policies["default"]), policies["roles"], policies["actions"]),
+        stages=tuple(_stage_from_json(stage) for stage in data["stages"])
+    )
+
+
+def load_plan(path: str, cache_dir: str = ".claude-squad/plans") -> ExecutionPlan:
+    """Plan for a workflow file, compiled once per distinct file content.
+
+    Plans are stored as plain JSON under `cache_dir`, keyed by the SHA-256 of
+    the YAML bytes (and PLAN_FORMAT), and rebuilt into dataclasses on load, so
+    a cache file from an untrusted checkout can never execute code. An
+    unreadable cache entry is simply recompiled.
+    """
+    source = Path(path).read_bytes()
+    source_hash = hashlib.sha256(source + f"\0plan-format-{PLAN_FORMAT}".encode()).hexdigest()
+    cached = Path(cache_dir) / f"{source_hash}.json"
+
+    if cached.exists():
+        try:
+            with open(cached) as f:
+                return _plan_from_json(json.load(f))
+        except Exception:
+            pass  # Corrupt or from an incompatible version: recompile
+
+    plan = compile_workflow(yaml.safe_load(source) or {}, source_hash)
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cached.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(_plan_to_json(plan), f)
+        os.replace(tmp, cached)  # Atomic: concurrent runs never read a partial plan
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return plan
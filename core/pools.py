@@ -0,0 +1,236 @@
+"""
+Claude Squad 6 - Role Worker Pools
+Bounded per-role concurrency with priority ready queues, weighted-fair
+sharing between tenants and utilization stats
+"""
+import heapq
+import itertools
+import time
+from typing import Dict, Any, Callable, Hashable, List, Optional, Set
+
+
+class RolePool:
+    """Slots and ready queue for a single role"""
+
+    def __init__(self, role: str, limit: Optional[int], clock: Callable[[], float]):
+        self.role = role
+        self.limit = limit  # None = unbounded
+        self.queues: Dict[Hashable, List[tuple]] = {}  # Tenant -> heap of (-priority, seq, enqueued_at, start)
+        self.withdrawn: Set[int] = set()  # Seqs of entries still in a heap that must not start
+        self.queued = 0
+        self.running = 0
+        self.clock = clock
+
+        # Stats
+        self.dispatched = 0
+        self.max_queue_depth = 0
+        self.max_running = 0
+        self.total_wait = 0.0
+        self.busy_time = 0.0  # Slot-seconds spent running tasks
+        self.started_at: Optional[float] = None
+        self._last_change: Optional[float] = None
+
+    @property
+    def has_capacity(self) -> bool:
+        return self.limit is None or self.running < self.limit
+
+    def _accumulate(self) -> None:
+        now = self.clock()
+        if self._last_change is not None:
+            self.busy_time += self.running * (now - self._last_change)
+        self._last_change = now
+        if self.started_at is None:
+            self.started_at = now
+
+    def stats(self) -> Dict[str, Any]:
+        self._accumulate()
+        elapsed = self._last_change - self.started_at if self.started_at is not None else 0.0
+        utilization = None
+        if self.limit and elapsed > 0:
+            utilization = self.busy_time / (self.limit * elapsed)
+        return {
+            "limit": self.limit,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queue_depth,
+            "max_running": self.max_running,
+            "dispatched": self.dispatched,
+            "avg_wait_seconds": self.total_wait / self.dispatched if self.dispatched else 0.0,
+            "busy_seconds": self.busy_time,
+            "utilization": utilization
+        }
+
+
+class RolePools:
+    """Dispatches queued work onto bounded per-role pools.
+
+    Callers `submit` a start callback per task; it is invoked once the role
+    (and the optional global limit) has a free slot, and the caller must
+    `release` the role when the task finishes. Among queued work the highest
+    priority head across all roles with free capacity is dispatched first.
+
+    Work submitted for different tenants (e.g. concurrent runs) is shared by
+    weighted fair queueing: each tenant's virtual time advances by
+    1 / weight per dispatched task and the tenant furthest behind goes next,
+    so a huge run cannot starve small ones. A tenant that was idle rejoins at
+    the current virtual time instead of cashing in credit for its idle period.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        default_limit: Optional[int] = None,
+        global_limit: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.limits = dict(limits or {})
+        self.default_limit = default_limit
+        self.global_limit = global_limit
+        self.clock = clock
+        self.pools: Dict[str, RolePool] = {}
+        self.running = 0
+        self._seq = itertools.count()
+        self._dispatching = False
+
+        # Weighted fair queueing between tenants
+        self.weights: Dict[Hashable, float] = {}
+        self.vtime: Dict[Hashable, float] = {}
+        self.backlog: Dict[Hashable, int] = {}  # Queued tasks per tenant
+        self.tenant_dispatched: Dict[Hashable, int] = {}
+        self.retired: Set[Hashable] = set()  # Removed tenants forgotten once their backlog drains
+        self.virtual_time = 0.0
+
+    @classmethod
+    def from_team_config(cls, team: Dict[str, Any], **kwargs) -> "RolePools":
+        """Build pools from the `team` section of claude.yaml"""
+        limits = {role: int(limit) for role, limit in (team.get("concurrency") or {}).items()}
+        return cls(limits, default_limit=team.get("default_concurrency"), **kwargs)
+
+    @property
+    def bounded(self) -> bool:
+        """Whether any limit can make tasks wait for a slot"""
+        return bool(self.limits) or self.default_limit is not None or self.global_limit is not None
+
+    def pool(self, role: str) -> RolePool:
+        pool = self.pools.get(role)
+        if pool is None:
+            pool = self.pools[role] = RolePool(role, self.limits.get(role, self.default_limit), self.clock)
+        return pool
+
+    def set_weight(self, tenant: Hashable, weight: float) -> None:
+        """Relative share of slots for a tenant (default 1)"""
+        if weight <= 0:
+            raise ValueError(f"Tenant weight must be positive, got {weight}")
+        self.weights[tenant] = weight
+        self.retired.discard(tenant)
+
+    def remove_tenant(self, tenant: Hashable) -> None:
+        """Forget a finished tenant's weight and accounting (after any queued work drains)"""
+        if self.backlog.get(tenant):
+            self.retired.add(tenant)
+            return
+        self._forget_tenant(tenant)
+
+    def _forget_tenant(self, tenant: Hashable) -> None:
+        self.retired.discard(tenant)
+        for table in (self.weights, self.vtime, self.backlog, self.tenant_dispatched):
+            table.pop(tenant, None)
+
+    def submit(self, role: str, start: Callable[[], None], priority: float = 0.0,
+               tenant: Hashable = None) -> int:
+        """Queue work for a role; `start` runs when a slot is free.
+
+        Returns a handle for `withdraw`.
+        """
+        pool = self.pool(role)
+        if not self.backlog.get(tenant):
+            self.vtime[tenant] = max(self.vtime.get(tenant, 0.0), self.virtual_time)
+        self.backlog[tenant] = self.backlog.get(tenant, 0) + 1
+
+        seq = next(self._seq)
+        heapq.heappush(pool.queues.setdefault(tenant, []), (-priority, seq, self.clock(), start))
+        pool.queued += 1
+        self._dispatch()
+        return seq
+
+    def withdraw(self, role: str, handle: int, tenant: Hashable = None) -> None:
+        """Drop queued work whose `start` has not run yet (e.g. its task was cancelled).
+
+        Entries are removed lazily: they stop counting at once and are
+        discarded when they reach the head of their heap.
+        """
+        pool = self.pools[role]
+        pool.withdrawn.add(handle)
+        pool.queued -= 1
+        self._drained(tenant)
+        self._purge(pool, tenant)
+
+    def _purge(self, pool: RolePool, tenant: Hashable) -> None:
+        """Pop withdrawn entries off the head of a tenant's heap, so heads are always live"""
+        queue = pool.queues.get(tenant)
+        while queue and queue[0][1] in pool.withdrawn:
+            pool.withdrawn.discard(heapq.heappop(queue)[1])
+        if queue is not None and not queue:
+            del pool.queues[tenant]
+
+    def _drained(self, tenant: Hashable) -> None:
+        self.backlog[tenant] -= 1
+        if not self.backlog[tenant] and tenant in self.retired:
+            self._forget_tenant(tenant)
+
+    def release(self, role: str) -> None:
+        """Return a slot taken by a started task"""
+        pool = self.pools[role]
+        pool._accumulate()
+        pool.running -= 1
+        self.running -= 1
+        self._dispatch()
+
+    def queue_depth(self, role: Optional[str] = None) -> int:
+        if role is not None:
+            return self.pools[role].queued if role in self.pools else 0
+        return sum(pool.queued for pool in self.pools.values())
+
+    def _dispatch(self) -> None:
+        # Start callbacks may release synchronously; the outer loop picks that up
+        if self._dispatching:
+            return
+        self._dispatching = True
+        try:
+            while self.global_limit is None or self.running < self.global_limit:
+                # Least-served tenant first, then the highest-priority head
+                best = best_tenant = best_key = None
+                for pool in self.pools.values():
+                    if not pool.queued or not pool.has_capacity:
+                        continue
+                    for tenant, queue in pool.queues.items():
+                        key = (self.vtime[tenant], queue[0])
+                        if best_key is None or key < best_key:
+                            best, best_tenant, best_key = pool, tenant, key
+                if best is None:
+                    return
+
+                _, _, enqueued_at, start = heapq.heappop(best.queues[best_tenant])
+                self._purge(best, best_tenant)
+                best.queued -= 1
+                self.virtual_time = self.vtime[best_tenant]
+                self.vtime[best_tenant] += 1.0 / self.weights.get(best_tenant, 1.0)
+                self.tenant_dispatched[best_tenant] = self.tenant_dispatched.get(best_tenant, 0) + 1
+                self._drained(best_tenant)
+
+                best._accumulate()
+                best.running += 1
+                best.max_running = max(best.max_running, best.running)
+                best.dispatched += 1
+                best.total_wait += self.clock() - enqueued_at
+                self.running += 1
+                start()
+        finally:
+            self._dispatching = False
+            # Only work left waiting for a slot counts towards the queue depth
+            for pool in self.pools.values():
+                pool.max_queue_depth = max(pool.max_queue_depth, pool.queued)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, wait and utilization per role"""
+        return {role: pool.stats() for role, pool in self.pools.items()}
@@ -0,0 +1,98 @@
+"""
+Claude Squad 6 - Model API Rate Limiting
+Shared async token buckets for requests/min and tokens/min quotas
+"""
+import asyncio
+import time
+from typing import Callable, Dict, Any, Optional
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at `rate` per second"""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)"""
+        self._refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """Request and token quotas shared by every task (and every run) using it.
+
+    Callers queue FIFO: the caller at the head of the queue waits until both
+    buckets can cover it, so a large request is never starved by a stream of
+    small ones and nothing is sent early only to come back as a 429.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.requests = TokenBucket(requests_per_minute / 60, requests_per_minute, clock) \
+            if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute, clock) \
+            if tokens_per_minute else None
+        self.clock = clock
+        self._lock: Optional[asyncio.Lock] = None
+        self.stats = {"acquired": 0, "throttled": 0, "wait_seconds": 0.0, "tokens": 0, "queued": 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["RateLimiter"]:
+        """Build from the `rate_limits` section of claude.yaml (None if unlimited)"""
+        requests = config.get("requests_per_minute")
+        tokens = config.get("tokens_per_minute")
+        if not requests and not tokens:
+            return None
+        return cls(requests, tokens)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait for one request slot plus `tokens` estimated tokens; returns seconds waited"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()  # asyncio.Lock wakes waiters in FIFO order
+
+        started = self.clock()
+        self.stats["queued"] += 1
+        try:
+            async with self._lock:
+                while True:
+                    wait = max(
+                        self.requests.time_until(1) if self.requests else 0.0,
+                        self.tokens.time_until(tokens) if self.tokens else 0.0
+                    )
+                    if wait <= 0:
+                        break
+                    await asyncio.sleep(wait)
+
+                if self.requests:
+                    self.requests.consume(1)
+                if self.tokens:
+                    self.tokens.consume(tokens)
+        finally:
+            self.stats["queued"] -= 1
+
+        waited = self.clock() - started
+        self.stats["acquired"] += 1
+        self.stats["tokens"] += tokens
+        self.stats["wait_seconds"] += waited
+        if waited > 0:
+            self.stats["throttled"] += 1
+        return waited
@@ -0,0 +1,45 @@
+"""
+Claude Squad 6 - Retry Policies
+Per-role and per-action timeouts and retries with jittered exponential backoff
+"""
+import random
+from dataclasses import dataclass, field, replace
+from typing import Dict, Any, Optional
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    timeout: Optional[float] = None  # Seconds per attempt; None = no limit
+    max_attempts: int = 1
+    backoff: float = 1.0             # Delay before the first retry
+    backoff_max: float = 60.0
+    jitter: float = 0.5              # Fraction of each delay that is randomized
+
+    def delay(self, attempt: int, rng: random.Random = random) -> float:
+        """Backoff after failed attempt number `attempt` (1-based)"""
+        ceiling = min(self.backoff_max, self.backoff * (2 ** (attempt - 1)))
+        return ceiling * (1 - self.jitter + self.jitter * rng.random())
+
+    def merged(self, overrides: Dict[str, Any]) -> "RetryPolicy":
+        """Copy with the given fields replaced"""
+        return replace(self, **overrides) if overrides else self
+
+
+@dataclass
+class RetryPolicies:
+    """Policy resolution: default, then role, then action, then per-task overrides"""
+
+    default: RetryPolicy = field(default_factory=RetryPolicy)
+    roles: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    actions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._resolved: Dict[tuple, RetryPolicy] = {}
+
+    def for_task(self, role: str, action: str, overrides: Optional[Dict[str, Any]] = None) -> RetryPolicy:
+        key = (role, action)
+        policy = self._resolved.get(key)
+        if policy is None:
+            policy = self.default.merged(self.roles.get(role, {})).merged(self.actions.get(action, {}))
+            self._resolved[key] = policy
+        return policy.merged(overrides or {})
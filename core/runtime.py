@@ -0,0 +1,83 @@
+"""
+Claude Squad 6 - Event Loop Runtime
+Single entry point for running coroutines: optional uvloop and loop tuning
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # Optional: `pip install uvloop` for a faster loop on Linux/macOS
+    uvloop = None
+
+T = TypeVar("T")
+
+LOOPS = ("auto", "uvloop", "asyncio")
+
+
+@dataclass(frozen=True)
+class RuntimeSettings:
+    loop: str = "auto"                       # auto = uvloop when installed
+    default_executor_workers: Optional[int] = None  # run_in_executor / to_thread pool size
+    debug: bool = False
+    slow_callback_ms: Optional[float] = None  # Log callbacks blocking the loop longer (enables debug)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RuntimeSettings":
+        """Read the `runtime` section of claude.yaml"""
+        section = config.get("runtime") or {}
+        settings = cls(
+            loop=section.get("loop", "auto"),
+            default_executor_workers=section.get("default_executor_workers"),
+            debug=bool(section.get("debug", False)),
+            slow_callback_ms=section.get("slow_callback_ms")
+        )
+        if settings.loop not in LOOPS:
+            raise ValueError(f"runtime.loop must be one of {', '.join(LOOPS)}, got {settings.loop!r}")
+        return settings
+
+
+def new_event_loop(settings: RuntimeSettings = RuntimeSettings()) -> asyncio.AbstractEventLoop:
+    """Create (but do not start) a loop configured by `settings`"""
+    if settings.loop == "uvloop" and uvloop is None:
+        raise RuntimeError("runtime.loop is 'uvloop' but uvloop is not installed")
+    if settings.loop != "asyncio" and uvloop is not None:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+
+    if settings.default_executor_workers:
+        loop.set_default_executor(ThreadPoolExecutor(settings.default_executor_workers,
+                                                     thread_name_prefix="claude-squad"))
+    # Slow-callback warnings are only emitted in debug mode
+    if settings.debug or settings.slow_callback_ms is not None:
+        loop.set_debug(True)
+    if settings.slow_callback_ms is not None:
+        loop.slow_callback_duration = settings.slow_callback_ms / 1000
+    return loop
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def run(main: Awaitable[T], config: Optional[Dict[str, Any]] = None) -> T:
+    """`asyncio.run` on a loop built from claude.yaml's `runtime` section"""
+    loop = new_event_loop(RuntimeSettings.from_config(config or {}))
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
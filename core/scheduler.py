@@ -0,0 +1,171 @@
+"""
+Claude Squad 6 - Dependency Scheduler
+Linear-time dependency graph with wave levels and an incremental ready queue
+"""
+import heapq
+from collections import deque
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .orchestrator import Task
+
+
+class DependencyGraph:
+    """Indexed task DAG with precomputed dependents adjacency"""
+
+    def __init__(self, tasks: Sequence["Task"]):
+        self.tasks: List["Task"] = list(tasks)
+        self.index: Dict[str, int] = {}
+        for i, task in enumerate(self.tasks):
+            if task.id in self.index:
+                raise ValueError(f"Duplicate task id: {task.id}")
+            self.index[task.id] = i
+
+        size = len(self.tasks)
+        self.dependents: List[List[int]] = [[] for _ in range(size)]
+        self.indegree: List[int] = [0] * size
+
+        missing = False
+        for i, task in enumerate(self.tasks):
+            for dep in task.dependencies:
+                j = self.index.get(dep)
+                if j is None:
+                    missing = True
+                    continue
+                self.dependents[j].append(i)
+                self.indegree[i] += 1
+
+        if missing:
+            self._raise_invalid()
+
+    def _raise_invalid(self) -> None:
+        """Full diagnosis (exact cycles, likely typos); only paid for on failure"""
+        from .validation import validate_graph
+        validate_graph(self.tasks).raise_for_errors()
+        raise ValueError("Invalid dependency graph")
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def topological_order(self) -> List[int]:
+        """Kahn's algorithm over task indexes, O(V+E)"""
+        return self._kahn()[0]
+
+    def levels(self) -> List[int]:
+        """Wave number of every task: 0 for roots, else 1 + deepest dependency"""
+        return self._kahn()[1]
+
+    def _kahn(self):
+        indegree = self.indegree.copy()
+        dependents = self.dependents
+        level = [0] * len(self.tasks)
+        queue = deque(i for i, degree in enumerate(indegree) if degree == 0)
+        order = []
+
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            next_level = level[i] + 1
+            for j in dependents[i]:
+                if level[j] < next_level:
+                    level[j] = next_level
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    queue.append(j)
+
+        if len(order) != len(self.tasks):
+            self._raise_invalid()
+        return order, level
+
+    def waves(self) -> List[List["Task"]]:
+        """Group tasks by level, keeping input order within each wave"""
+        if not self.tasks:
+            return []
+        level = self.levels()
+        waves: List[List["Task"]] = [[] for _ in range(max(level) + 1)]
+        for i, task in enumerate(self.tasks):
+            waves[level[i]].append(task)
+        return waves
+
+
+    def critical_path(self, durations: Sequence[float]) -> List[float]:
+        """Longest remaining path (own duration included) from every task to a sink"""
+        remaining = list(durations)
+        for i in reversed(self.topological_order()):
+            tail = 0.0
+            for j in self.dependents[i]:
+                if remaining[j] > tail:
+                    tail = remaining[j]
+            remaining[i] = durations[i] + tail
+        return remaining
+
+
+def task_durations(tasks: Sequence["Task"], default: float = 0.0) -> List[float]:
+    """Read the `duration` metadata (seconds) of every task"""
+    return [task.meta("duration", default) for task in tasks]
+
+
+def simulate_makespan(tasks: Sequence["Task"], workers: int, prioritized: bool = True) -> float:
+    """List-schedule tasks on `workers` identical slots using their durations.
+
+    With `prioritized` ready tasks are dispatched longest-remaining-path first,
+    otherwise in FIFO (ready) order.
+    """
+    graph = DependencyGraph(tasks)
+    durations = task_durations(graph.tasks)
+    ready = ReadyQueue(graph, graph.critical_path(durations) if prioritized else None)
+    running: List[tuple] = []
+    now = 0.0
+
+    while ready or running:
+        while ready and len(running) < workers:
+            index = ready.pop()
+            heapq.heappush(running, (now + durations[index], index))
+        now, index = heapq.heappop(running)
+        ready.complete(index)
+    return now
+
+
+class ReadyQueue:
+    """Incremental indegree tracker: yields tasks as their dependencies complete.
+
+    Without priorities tasks come out in FIFO order; with priorities the
+    highest-priority ready task is popped first (ties keep input order).
+    """
+
+    def __init__(self, graph: DependencyGraph, priorities: Optional[Sequence[float]] = None):
+        self.graph = graph
+        self.priorities = priorities
+        self.remaining = graph.indegree.copy()
+        roots = [i for i, degree in enumerate(self.remaining) if degree == 0]
+        if priorities is None:
+            self.ready = deque(roots)
+        else:
+            self.ready = [(-priorities[i], i) for i in roots]
+            heapq.heapify(self.ready)
+
+    def __bool__(self) -> bool:
+        return bool(self.ready)
+
+    def __len__(self) -> int:
+        return len(self.ready)
+
+    def pop(self) -> int:
+        """Take the next ready task index"""
+        if self.priorities is None:
+            return self.ready.popleft()
+        return heapq.heappop(self.ready)[1]
+
+    def complete(self, index: int) -> List[int]:
+        """Mark a task done and return the indexes that became ready"""
+        newly_ready = []
+        for j in self.graph.dependents[index]:
+            self.remaining[j] -= 1
+            if self.remaining[j] == 0:
+                newly_ready.append(j)
+        if self.priorities is None:
+            self.ready.extend(newly_ready)
+        else:
+            for j in newly_ready:
+                heapq.heappush(self.ready, (-self.priorities[j], j))
+        return newly_ready
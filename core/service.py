@@ -0,0 +1,106 @@
+"""
+Claude Squad 6 - Orchestrator Service
+Long-lived multi-tenant host running many workflow runs on shared resources
+"""
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .orchestrator import ParallelOrchestrator, Task
+
+
+class OrchestratorService:
+    """Runs many task graphs concurrently on one event loop.
+
+    Every run gets its own ParallelOrchestrator, so task IDs, results,
+    journals and incremental state never leak between runs. Role pools,
+    the result cache, single-flight coalescing, the rate limiter, admission
+    control, the model backend, hedging budget, metrics and executors are
+    shared, and pool slots are divided between runs by weighted fair
+    queueing (see `RolePools`).
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, **kwargs):
+        # Template holding the shared resources; it never runs tasks itself
+        self.shared = ParallelOrchestrator.from_config(config or {}, **kwargs)
+        self.pools = self.shared.pools
+        self.runs: Dict[str, ParallelOrchestrator] = {}
+        self.stats = {"started": 0, "finished": 0}
+
+    def open_run(self, run_id: Optional[str] = None, weight: float = 1.0, **kwargs) -> ParallelOrchestrator:
+        """Create an isolated orchestrator for one run on the shared resources.
+
+        Extra keyword arguments (dataflow, fail_fast, policies, journal, ...)
+        apply to this run only. Call `close_run` when it is done.
+        """
+        run_id = run_id or uuid.uuid4().hex[:8]
+        if run_id in self.runs:
+            raise ValueError(f"Run '{run_id}' is already active")
+
+        shared = self.shared
+        batcher = shared.batcher
+        orchestrator = ParallelOrchestrator(
+            pools=self.pools,
+            cache=shared.cache,
+            metrics=shared.metrics,
+            hedging=shared.hedging,
+            singleflight=shared.singleflight,
+            rate_limiter=shared.rate_limiter,
+            admission=shared.admission,
+            backend=shared.backend,
+            batch_window=batcher.window if batcher else None,
+            max_batch=batcher.max_batch if batcher else 8,
+            run_id=run_id,
+            **kwargs
+        )
+        orchestrator.executors = dict(shared.executors)  # Per-run routing; the executors themselves are shared
+        orchestrator.default_executor = shared.default_executor
+        orchestrator.hooks_runner = shared.hooks_runner
+
+        self.pools.set_weight(run_id, weight)
+        self.runs[run_id] = orchestrator
+        self.stats["started"] += 1
+        return orchestrator
+
+    def close_run(self, run_id: str) -> None:
+        """Release a finished run's tenant state"""
+        orchestrator = self.runs.pop(run_id)
+        self.pools.remove_tenant(run_id)
+        if orchestrator.incremental is not None:
+            orchestrator.incremental.save()
+        self.stats["finished"] += 1
+
+    async def run(self, tasks: List[Task], run_id: Optional[str] = None, weight: float = 1.0,
+                  **kwargs) -> List[Task]:
+        """Execute one run's tasks and return them, like `execute_wave`"""
+        orchestrator = self.open_run(run_id, weight, **kwargs)
+        try:
+            return await orchestrator.execute_wave(tasks)
+        finally:
+            self.close_run(orchestrator.run_id)
+
+    async def stream(self, tasks: List[Task], run_id: Optional[str] = None, weight: float = 1.0,
+                     **kwargs) -> AsyncIterator[Task]:
+        """Execute one run's tasks, yielding each as it finishes"""
+        orchestrator = self.open_run(run_id, weight, **kwargs)
+        stream = orchestrator.stream(tasks)
+        try:
+            async for task in stream:
+                yield task
+        finally:
+            # Close the inner stream now (cancelling its work) rather than at garbage collection
+            await stream.aclose()
+            self.close_run(orchestrator.run_id)
+
+    def tenant_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Weight, queued and dispatched tasks per active run"""
+        return {
+            run_id: {
+                "weight": self.pools.weights.get(run_id, 1.0),
+                "queued": self.pools.backlog.get(run_id, 0),
+                "dispatched": self.pools.tenant_dispatched.get(run_id, 0)
+            }
+            for run_id in self.runs
+        }
+
+    def shutdown(self) -> None:
+        self.shared.shutdown()
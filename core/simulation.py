@@ -0,0 +1,149 @@
+"""
+Claude Squad 6 - Capacity Simulation
+Discrete-event replay of the orchestrator's scheduling on a virtual clock
+"""
+import heapq
+import itertools
+import random
+import statistics
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .distributions import Distribution, Fixed
+from .plan import ExecutionPlan, StagePlan
+from .pools import RolePools
+from .scheduler import DependencyGraph, ReadyQueue
+
+
+class VirtualClock:
+    """Callable clock whose time only moves when the simulator advances it"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class SimulationResult:
+    makespan: float
+    roles: Dict[str, Dict[str, Any]]  # RolePools.stats() at the end of the run
+
+
+class _Stage:
+    """Per-stage data that does not change between scenarios"""
+
+    def __init__(self, stage: StagePlan, default_duration: float):
+        self.graph = DependencyGraph(stage.tasks)
+        self.roles = [spec.role for spec in stage.tasks]
+        self.durations = [spec.duration if spec.duration is not None else default_duration
+                          for spec in stage.tasks]
+        self.priorities = self.graph.critical_path(self.durations)
+        self.levels = stage.levels
+
+
+class Simulator:
+    """Runs a compiled plan through RolePools and ReadyQueue with sampled durations.
+
+    Mirrors the orchestrator: stages run one after another; within a stage
+    tasks start as soon as their dependencies finish (`dataflow`) or wave by
+    wave, and bounded pools dispatch the longest remaining path first.
+    """
+
+    def __init__(
+        self,
+        plan: ExecutionPlan,
+        limits: Optional[Dict[str, int]] = None,
+        default_limit: Optional[int] = None,
+        global_limit: Optional[int] = None,
+        dataflow: bool = True,
+        latency: Optional[Distribution] = None,
+        default_duration: float = 1800.0,
+        seed: Optional[int] = None
+    ):
+        if not plan.ok:
+            raise ValueError("Cannot simulate an invalid plan")
+        self.plan = plan
+        self.limits = dict(limits or {})
+        self.default_limit = default_limit
+        self.global_limit = global_limit
+        self.dataflow = dataflow
+        self.latency = latency or Fixed()
+        self.rng = random.Random(seed)
+        self.stages = [_Stage(stage, default_duration) for stage in plan.stages if stage.tasks]
+
+    def run(self) -> SimulationResult:
+        """One scenario: sample every task duration and play the plan to completion"""
+        clock = VirtualClock()
+        pools = RolePools(self.limits, self.default_limit, self.global_limit, clock=clock)
+        for stage in self.stages:
+            self._run_stage(stage, pools, clock)
+        return SimulationResult(clock.now, pools.stats())
+
+    def _run_stage(self, stage: _Stage, pools: RolePools, clock: VirtualClock) -> None:
+        rng, latency = self.rng, self.latency
+        durations = [duration * latency.sample(rng) for duration in stage.durations]
+        priorities = stage.priorities if pools.bounded else None
+        events: List[Tuple[float, int, int]] = []  # (finish time, seq, task index)
+        seq = itertools.count()
+
+        def launch(index: int) -> None:
+            def start() -> None:
+                heapq.heappush(events, (clock.now + durations[index], next(seq), index))
+            pools.submit(stage.roles[index], start, priorities[index] if priorities else 0.0)
+
+        def drain(ready: Optional[ReadyQueue]) -> None:
+            while events:
+                clock.now, _, index = heapq.heappop(events)
+                pools.release(stage.roles[index])
+                if ready is not None:
+                    ready.complete(index)
+                    while ready:
+                        launch(ready.pop())
+
+        if self.dataflow:
+            ready = ReadyQueue(stage.graph)
+            while ready:
+                launch(ready.pop())
+            drain(ready)
+        else:
+            waves: List[List[int]] = [[] for _ in range(max(stage.levels) + 1)]
+            for index, level in enumerate(stage.levels):
+                waves[level].append(index)
+            for wave in waves:
+                for index in wave:
+                    launch(index)
+                drain(None)
+
+
+def summarize(results: Sequence[SimulationResult]) -> Dict[str, Any]:
+    """Makespan percentiles plus mean utilization and queue wait per role"""
+    makespans = sorted(result.makespan for result in results)
+    roles: Dict[str, Dict[str, float]] = {}
+    for role in results[0].roles:
+        stats = [result.roles[role] for result in results]
+        utilization = [s["utilization"] for s in stats if s["utilization"] is not None]
+        roles[role] = {
+            "limit": stats[0]["limit"],
+            "utilization": statistics.fmean(utilization) if utilization else None,
+            "avg_wait_seconds": statistics.fmean(s["avg_wait_seconds"] for s in stats),
+            "max_queued": max(s["max_queued"] for s in stats)
+        }
+    return {
+        "runs": len(results),
+        "makespan_mean": statistics.fmean(makespans),
+        "makespan_p50": makespans[len(makespans) // 2],
+        "makespan_p90": makespans[min(len(makespans) - 1, int(len(makespans) * 0.9))],
+        "roles": roles
+    }
+
+
+def sweep(plan: ExecutionPlan, scenarios: Sequence[Dict[str, int]], runs: int = 1000,
+          **kwargs) -> List[Tuple[Dict[str, int], Dict[str, Any]]]:
+    """Simulate each role-limit configuration `runs` times and summarize it"""
+    summaries = []
+    for limits in scenarios:
+        simulator = Simulator(plan, limits=limits, **kwargs)
+        summaries.append((limits, summarize([simulator.run() for _ in range(runs)])))
+    return summaries
@@ -0,0 +1,56 @@
+"""
+Claude Squad 6 - Single-flight Coalescing
+Identical in-flight submissions share one execution instead of starting new work
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls by key.
+
+    The first caller for a key starts the work as its own asyncio task; later
+    callers with the same key await that task while it is in flight. A caller
+    being cancelled only cancels the shared work once no other caller is still
+    waiting for it. Share one instance between orchestrators to coalesce
+    across concurrent runs.
+    """
+
+    def __init__(self):
+        self.flights: Dict[str, _Flight] = {}
+        self.stats = {"executions": 0, "coalesced": 0}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self.flights
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn()` unless an identical call is in flight; return the shared result"""
+        flight = self.flights.get(key)
+        if flight is None:
+            flight = self.flights[key] = _Flight(asyncio.ensure_future(fn()))
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+            self.stats["executions"] += 1
+        else:
+            self.stats["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        if self.flights.get(key) is flight:
+            del self.flights[key]
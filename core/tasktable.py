@@ -0,0 +1,116 @@
+"""
+Claude Squad 6 - Task Table
+Array-backed task graph for bulk (million-node) workloads
+"""
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from .orchestrator import Task, TaskStatus
+
+# Status codes stored in the table's bytearray, in TaskStatus declaration order
+STATUS_CODES = {status: code for code, status in enumerate(TaskStatus)}
+STATUSES = list(TaskStatus)
+
+
+class TaskTable:
+    """Struct-of-arrays task graph.
+
+    Roles and actions are stored as small integer codes into interned string
+    tables, dependencies in CSR form (`dep_offsets` / `dep_targets`) and
+    statuses in a bytearray. Tasks must be added after their dependencies, so
+    insertion order is a topological order and levels take a single pass.
+    Individual rows can be materialized as `Task` objects on demand.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []  # Interned role/action strings
+        self._codes: Dict[str, int] = {}
+        self.roles = array("H")
+        self.actions = array("H")
+        self.dep_offsets = array("q", [0])
+        self.dep_targets = array("q")
+        self.status = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return code
+
+    def add(self, id: str, role: str, action: str, dependencies: Iterable[str] = ()) -> int:
+        """Append a task whose dependencies were already added; returns its row"""
+        if id in self.index:
+            raise ValueError(f"Duplicate task id: {id}")
+        for dep in dependencies:
+            row = self.index.get(dep)
+            if row is None:
+                raise ValueError(f"Unknown dependency IDs: {id} -> {dep}")
+            self.dep_targets.append(row)
+        self.dep_offsets.append(len(self.dep_targets))
+
+        row = len(self.ids)
+        self.index[id] = row
+        self.ids.append(id)
+        self.roles.append(self._code(role))
+        self.actions.append(self._code(action))
+        self.status.append(STATUS_CODES[TaskStatus.PENDING])
+        return row
+
+    def dependencies(self, row: int) -> List[int]:
+        return self.dep_targets[self.dep_offsets[row]:self.dep_offsets[row + 1]].tolist()
+
+    def levels(self) -> array:
+        """Wave number per row in one pass (rows are topologically ordered)"""
+        level = array("l", bytes(array("l").itemsize * len(self.ids)))
+        offsets, targets = self.dep_offsets, self.dep_targets
+        for row in range(len(self.ids)):
+            deepest = -1
+            for k in range(offsets[row], offsets[row + 1]):
+                if level[targets[k]] > deepest:
+                    deepest = level[targets[k]]
+            level[row] = deepest + 1
+        return level
+
+    def waves(self) -> List[List[int]]:
+        """Rows grouped by level, in insertion order"""
+        level = self.levels()
+        waves: List[List[int]] = [[] for _ in range(max(level) + 1)] if len(level) else []
+        for row, lvl in enumerate(level):
+            waves[lvl].append(row)
+        return waves
+
+    def get_status(self, row: int) -> TaskStatus:
+        return STATUSES[self.status[row]]
+
+    def set_status(self, row: int, status: TaskStatus) -> None:
+        self.status[row] = STATUS_CODES[status]
+
+    def task(self, row: int, params: Optional[Dict] = None) -> Task:
+        """Materialize one row as a Task"""
+        return Task(
+            id=self.ids[row],
+            role=self.names[self.roles[row]],
+            action=self.names[self.actions[row]],
+            dependencies=[self.ids[dep] for dep in self.dependencies(row)],
+            params=params,
+            status=self.get_status(row)
+        )
+
+    def to_tasks(self) -> List[Task]:
+        return [self.task(row) for row in range(len(self.ids))]
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "TaskTable":
+        """Build a table from tasks listed in dependency order"""
+        table = cls()
+        for task in tasks:
+            table.add(task.id, task.role, task.action, task.dependencies)
+            table.set_status(len(table) - 1, task.status)
+        return table
@@ -0,0 +1,161 @@
+"""
+Claude Squad 6 - Graph Validation
+Linear-time detection of duplicate IDs, missing references and exact cycles
+"""
+import difflib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .cache import stable_hash
+
+if TYPE_CHECKING:
+    from .orchestrator import Task
+
+
+class GraphValidationError(ValueError):
+    """A task graph that cannot be scheduled"""
+
+    def __init__(self, result: "ValidationResult"):
+        super().__init__(result.describe())
+        self.result = result
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    signature: str
+    duplicates: Tuple[str, ...] = ()
+    missing: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = ()  # (task, unknown dep, close matches)
+    cycles: Tuple[Tuple[str, ...], ...] = ()  # One concrete cycle per cyclic component, a -> b = a needs b
+    components: Tuple[Tuple[str, ...], ...] = ()  # Every task in each cyclic component
+
+    @property
+    def ok(self) -> bool:
+        return not (self.duplicates or self.missing or self.cycles)
+
+    def describe(self) -> str:
+        """Human-readable list of every problem found"""
+        problems = []
+        if self.duplicates:
+            problems.append(f"Duplicate task ids: {', '.join(self.duplicates)}")
+        for task_id, dep, matches in self.missing:
+            hint = f" (did you mean {' or '.join(repr(m) for m in matches)}?)" if matches else ""
+            problems.append(f"Unknown dependency IDs: {task_id} -> {dep}{hint}")
+        for cycle, component in zip(self.cycles, self.components):
+            extra = len(component) - len(cycle) + 1
+            problems.append(f"Circular dependency: {' -> '.join(cycle)}"
+                            + (f" (component of {len(component)} tasks)" if extra > 0 else ""))
+        return "; ".join(problems) if problems else "OK"
+
+    def raise_for_errors(self) -> None:
+        if not self.ok:
+            raise GraphValidationError(self)
+
+
+def graph_signature(tasks: Sequence["Task"]) -> str:
+    """Content hash of the graph shape (IDs and dependency lists)"""
+    return stable_hash([(task.id, list(task.dependencies)) for task in tasks])
+
+
+def strongly_connected_components(successors: List[List[int]]) -> List[List[int]]:
+    """Tarjan's algorithm, iterative so deep chains cannot hit the recursion limit. O(V+E)"""
+    size = len(successors)
+    index = [-1] * size
+    lowlink = [0] * size
+    on_stack = [False] * size
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(size):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, edge = work[-1]
+            if edge == 0:
+                index[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+
+            edges = successors[node]
+            while edge < len(edges):
+                nxt = edges[edge]
+                edge += 1
+                if index[nxt] == -1:
+                    work[-1] = (node, edge)
+                    work.append((nxt, 0))
+                    break
+                if on_stack[nxt] and index[nxt] < lowlink[node]:
+                    lowlink[node] = index[nxt]
+            else:
+                work.pop()
+                if work and lowlink[node] < lowlink[work[-1][0]]:
+                    lowlink[work[-1][0]] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _cycle_in(component: List[int], successors: List[List[int]]) -> List[int]:
+    """One concrete cycle inside a strongly connected component, closed at both ends"""
+    members = set(component)
+    seen: Dict[int, int] = {}
+    path: List[int] = []
+    node = min(component)
+    while node not in seen:
+        seen[node] = len(path)
+        path.append(node)
+        node = next(j for j in successors[node] if j in members)
+    return path[seen[node]:] + [node]
+
+
+# Typo hints compare an unknown reference against every ID; they stop once this
+# many comparisons have been spent, so validation stays O(V+E) however many are missing
+_HINT_BUDGET = 10000
+
+
+def validate_graph(tasks: Sequence["Task"], signature: Optional[str] = None) -> ValidationResult:
+    """Check a task graph in O(V+E): duplicate IDs, unknown dependencies and cycles"""
+    index: Dict[str, int] = {}
+    duplicates = []
+    for i, task in enumerate(tasks):
+        if task.id in index:
+            duplicates.append(task.id)
+        else:
+            index[task.id] = i
+
+    # Edges point from a task to its dependencies, matching how cycles are reported
+    successors: List[List[int]] = [[] for _ in tasks]
+    missing = []
+    for i, task in enumerate(tasks):
+        for dep in task.dependencies:
+            j = index.get(dep)
+            if j is None:
+                hinted = (len(missing) + 1) * len(index) <= _HINT_BUDGET
+                hints = difflib.get_close_matches(dep, index, n=2) if hinted else []
+                missing.append((task.id, dep, tuple(hints)))
+            elif index[task.id] == i:
+                successors[i].append(j)
+
+    cycles, components = [], []
+    for component in strongly_connected_components(successors):
+        if len(component) > 1 or component[0] in successors[component[0]]:
+            cycles.append(tuple(tasks[i].id for i in _cycle_in(component, successors)))
+            components.append(tuple(sorted(tasks[i].id for i in component)))
+
+    return ValidationResult(
+        signature=signature or graph_signature(tasks),
+        duplicates=tuple(duplicates),
+        missing=tuple(missing),
+        cycles=tuple(cycles),
+        components=tuple(components)
+    )
+
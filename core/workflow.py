@@ -0,0 +1,100 @@
+"""
+Claude Squad 6 - Workflow Loader
+Turns workflows/*.yaml stages into Task objects with duration metadata
+"""
+import re
+from typing import Dict, Any, List, Optional
+
+from .orchestrator import Task
+from .retry import RetryPolicy, RetryPolicies
+
+# Seconds per unit; a "day" is a calendar day so stage and task durations compare directly
+DURATION_UNITS = {
+    "s": 1, "sec": 1, "second": 1, "seconds": 1,
+    "m": 60, "min": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hr": 3600, "hour": 3600, "hours": 3600,
+    "d": 86400, "day": 86400, "days": 86400,
+    "w": 604800, "week": 604800, "weeks": 604800,
+}
+
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$")
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """Parse "30m", "1.5d", "4 hours" or a bare number of seconds into seconds"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    match = _DURATION_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid duration: {value!r}")
+
+    amount, unit = match.groups()
+    unit = unit.lower() or "s"
+    if unit not in DURATION_UNITS:
+        raise ValueError(f"Unknown duration unit in {value!r}")
+    return float(amount) * DURATION_UNITS[unit]
+
+
+# Workflow YAML keys -> RetryPolicy fields
+_POLICY_DURATIONS = {"timeout": "timeout", "backoff": "backoff", "backoff_max": "backoff_max"}
+
+
+def policy_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate `timeout`, `retries`, `backoff`, ... entries into RetryPolicy fields"""
+    overrides: Dict[str, Any] = {}
+    for key, name in _POLICY_DURATIONS.items():
+        if key in config:
+            overrides[name] = parse_duration(config[key])
+    if "retries" in config:
+        overrides["max_attempts"] = int(config["retries"]) + 1
+    if "max_attempts" in config:
+        overrides["max_attempts"] = int(config["max_attempts"])
+    if "jitter" in config:
+        overrides["jitter"] = float(config["jitter"])
+    return overrides
+
+
+def load_policies(config: Dict[str, Any]) -> RetryPolicies:
+    """Build retry/timeout policies from a workflow's `policies` section"""
+    section = config.get("policies") or {}
+    return RetryPolicies(
+        default=RetryPolicy().merged(policy_overrides(section.get("default") or {})),
+        roles={role: policy_overrides(c or {}) for role, c in (section.get("roles") or {}).items()},
+        actions={action: policy_overrides(c or {}) for action, c in (section.get("actions") or {}).items()}
+    )
+
+
+def stage_task_configs(stage: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten a stage's `tasks` list and any `waves: [{tasks: [...]}]` blocks"""
+    configs = list(stage.get("tasks") or [])
+    for wave in stage.get("waves") or []:
+        configs.extend(wave.get("tasks") or [])
+    return configs
+
+
+def build_task(task_config: Dict[str, Any], params: Optional[Dict[str, Any]] = None) -> Task:
+    """Create a Task from one workflow task entry"""
+    metadata = {}
+    duration = parse_duration(task_config.get("duration"))
+    if duration is not None:
+        metadata["duration"] = duration
+    policy = policy_overrides(task_config)
+    if policy:
+        metadata["policy"] = policy
+
+    return Task(
+        id=task_config["id"],
+        role=task_config["role"],
+        action=task_config["action"],
+        dependencies=list(task_config.get("dependencies", [])),
+        params=dict(params or {}),
+        metadata=metadata
+    )
+
+
+def load_stage_tasks(stage: Dict[str, Any], description: str) -> List[Task]:
+    """Build the Task list for one workflow stage"""
+    return [build_task(config, {"description": description}) for config in stage_task_configs(stage)]
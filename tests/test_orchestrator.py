@@ -0,0 +1,228 @@
+"""ParallelOrchestrator: cancellation, fail-fast, early stream close and admission slots"""
+import asyncio
+
+import pytest
+
+from core.admission import AdmissionController
+from core.backends import SleepBackend
+from core.events import EventMetrics
+from core.executors import TaskExecutor
+from core.orchestrator import ParallelOrchestrator, Task, TaskStatus
+from core.service import OrchestratorService
+
+TERMINAL = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED, TaskStatus.CANCELLED}
+
+
+class ScriptedExecutor(TaskExecutor):
+    """Fails the tasks in `failing`, blocks the rest until `release` is set"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.release = asyncio.Event()
+        self.started = []
+
+    async def run(self, orchestrator, task):
+        self.started.append(task.id)
+        if task.id in self.failing:
+            await asyncio.sleep(0)
+            raise RuntimeError(f"{task.id} failed")
+        await self.release.wait()
+        return {"id": task.id}
+
+
+def make_orchestrator(**kwargs) -> ParallelOrchestrator:
+    kwargs.setdefault("backend", SleepBackend(0))
+    return ParallelOrchestrator(metrics=EventMetrics(), **kwargs)
+
+
+def assert_drained(orchestrator: ParallelOrchestrator, graph: bool = True) -> None:
+    pools = orchestrator.pools
+    assert pools.running == 0
+    assert pools.queue_depth() == 0
+    assert not any(pools.backlog.values())
+    if graph:  # Graph runs drop upstream results once nothing reads them
+        assert orchestrator.completed == {}
+    if orchestrator.admission is not None:
+        assert orchestrator.admission.in_flight == 0
+        assert orchestrator.admission.queued == 0
+
+
+def chain(length: int, role: str = "backend_dev"):
+    return [Task(f"t{i}", role, "step", [f"t{i - 1}"] if i else None) for i in range(length)]
+
+
+@pytest.mark.parametrize("dataflow", [False, True])
+async def test_fail_fast_cancels_siblings(dataflow):
+    executor = ScriptedExecutor(failing={"bad"})
+    orchestrator = make_orchestrator(dataflow=dataflow, fail_fast=True)
+    orchestrator.set_executor(executor)
+    tasks = [Task("bad", "backend_dev", "x"), Task("slow", "frontend_dev", "x"),
+             Task("after", "qa_engineer", "x", ["slow"])]
+
+    await asyncio.wait_for(orchestrator.execute_wave(tasks), timeout=5)
+
+    status = {task.id: task.status for task in tasks}
+    assert status == {"bad": TaskStatus.FAILED, "slow": TaskStatus.CANCELLED,
+                      "after": TaskStatus.SKIPPED}
+    assert "after" not in executor.started
+    assert_drained(orchestrator)
+
+
+@pytest.mark.parametrize("dataflow", [False, True])
+async def test_failure_skips_dependents_without_fail_fast(dataflow):
+    orchestrator = make_orchestrator(dataflow=dataflow)
+    executor = ScriptedExecutor(failing={"t0"})
+    orchestrator.set_executor(executor)
+    tasks = chain(3)
+
+    await orchestrator.execute_wave(tasks)
+
+    assert [task.status for task in tasks] == [TaskStatus.FAILED, TaskStatus.SKIPPED, TaskStatus.SKIPPED]
+    assert executor.started == ["t0"]
+    assert_drained(orchestrator)
+
+
+async def test_cancelling_dataflow_stops_dependents():
+    executor = ScriptedExecutor()
+    orchestrator = make_orchestrator(dataflow=True)
+    orchestrator.set_executor(executor)
+    tasks = chain(4)
+
+    runner = asyncio.ensure_future(orchestrator.execute_wave(tasks))
+    while not executor.started:
+        await asyncio.sleep(0)
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+    assert tasks[0].status == TaskStatus.CANCELLED
+    assert all(task.status == TaskStatus.PENDING for task in tasks[1:])
+    assert executor.started == ["t0"]
+    assert_drained(orchestrator)
+
+
+async def test_cancelled_waiters_are_withdrawn_from_pools():
+    executor = ScriptedExecutor()
+    orchestrator = make_orchestrator(role_limits={"backend_dev": 1})
+    orchestrator.set_executor(executor)
+    tasks = [Task(f"t{i}", "backend_dev", "x") for i in range(4)]
+
+    futures = [orchestrator._schedule(task) for task in tasks]
+    await asyncio.sleep(0)
+    assert orchestrator.pools.queue_depth("backend_dev") == 3
+
+    for future in futures[1:]:
+        future.cancel()
+    await asyncio.gather(*futures[1:], return_exceptions=True)
+    assert orchestrator.pools.queue_depth("backend_dev") == 0
+    assert all(task.status == TaskStatus.SKIPPED for task in tasks[1:])
+
+    executor.release.set()
+    await futures[0]
+    assert executor.started == ["t0"]
+    assert_drained(orchestrator, graph=False)
+
+
+async def test_admission_slots_released_on_cancel_and_skip():
+    executor = ScriptedExecutor()
+    admission = AdmissionController(max_in_flight=1)
+    orchestrator = make_orchestrator(admission=admission)
+    orchestrator.set_executor(executor)
+    tasks = [Task(f"t{i}", "backend_dev", "x") for i in range(3)]
+
+    futures = [orchestrator._schedule(task) for task in tasks]
+    while not executor.started:
+        await asyncio.sleep(0)
+    assert (admission.in_flight, admission.queued) == (1, 2)
+
+    for future in futures:
+        future.cancel()
+    await asyncio.gather(*futures, return_exceptions=True)
+
+    assert [task.status for task in tasks] == [TaskStatus.CANCELLED, TaskStatus.SKIPPED, TaskStatus.SKIPPED]
+    assert_drained(orchestrator)
+
+    # The controller is still usable afterwards
+    executor.release.set()
+    [task] = await orchestrator.execute_wave([Task("next", "backend_dev", "x")])
+    assert task.status == TaskStatus.COMPLETED
+    assert_drained(orchestrator)
+
+
+async def test_admission_slot_released_when_task_is_cancelled_before_first_step():
+    admission = AdmissionController(max_in_flight=1)
+    orchestrator = make_orchestrator(admission=admission)
+    await admission.admit()
+
+    future = orchestrator._schedule(Task("t", "backend_dev", "x"), admitted=True)
+    future.cancel()  # Before run() ever starts
+    await asyncio.gather(future, return_exceptions=True)
+
+    assert_drained(orchestrator)
+
+
+@pytest.mark.parametrize("dataflow", [False, True])
+async def test_stream_closed_early(dataflow):
+    executor = ScriptedExecutor(failing={"t0"})
+    orchestrator = make_orchestrator(dataflow=dataflow, role_limits={"backend_dev": 1},
+                                     admission=AdmissionController(max_in_flight=2))
+    orchestrator.set_executor(executor)
+    tasks = [Task(f"t{i}", "backend_dev", "x") for i in range(5)]
+
+    stream = orchestrator.stream(tasks)
+    async for task in stream:
+        assert task.id == "t0"
+        break
+    await stream.aclose()
+
+    assert all(task.status in TERMINAL for task in tasks)
+    assert orchestrator.event_handlers == []
+    assert_drained(orchestrator)
+
+
+async def test_stream_yields_every_task_once():
+    orchestrator = make_orchestrator(dataflow=True)
+    tasks = chain(3) + [Task("side", "qa_engineer", "x")]
+
+    seen = [task.id async for task in orchestrator.stream(tasks)]
+
+    assert sorted(seen) == ["side", "t0", "t1", "t2"]
+    assert seen.index("t0") < seen.index("t1") < seen.index("t2")
+    assert_drained(orchestrator)
+
+
+@pytest.mark.parametrize("dataflow", [False, True])
+async def test_service_stream_closed_early(dataflow):
+    config = {"team": {"concurrency": {"backend_dev": 1}},
+              "admission": {"max_in_flight": 2, "max_queued": 100}}
+    service = OrchestratorService(config, backend=SleepBackend(0.01), metrics=EventMetrics())
+    tasks = [Task(f"t{i}", "backend_dev", "x", params={"i": i}) for i in range(5)]
+
+    stream = service.stream(tasks, run_id="early", dataflow=dataflow)
+    async for _ in stream:
+        break
+    await stream.aclose()
+
+    assert all(task.status in TERMINAL for task in tasks)
+    assert service.pools.running == 0 and service.pools.queue_depth() == 0
+    assert "early" not in service.pools.backlog
+    assert service.shared.admission.in_flight == 0
+
+    # Shared pools keep serving other runs
+    [task] = await service.run([Task("z", "backend_dev", "x")], run_id="later")
+    assert task.status == TaskStatus.COMPLETED
+    service.shutdown()
+
+
+async def test_service_runs_have_separate_routing():
+    service = OrchestratorService({}, backend=SleepBackend(0), metrics=EventMetrics())
+    first = service.open_run("first")
+    second = service.open_run("second")
+
+    first.set_executor(ScriptedExecutor(), role="backend_dev")
+
+    task = Task("t", "backend_dev", "x")
+    assert first.executor_for(task) is not second.executor_for(task)
+    service.close_run("first")
+    service.close_run("second")
+    service.shutdown()
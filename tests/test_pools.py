@@ -0,0 +1,88 @@
+"""RolePools: withdrawal of cancelled work, queue depth and weighted-fair sharing"""
+from core.pools import RolePools
+
+
+def test_withdrawn_entries_never_start():
+    pools = RolePools({"qa_engineer": 1})
+    started = []
+    pools.submit("qa_engineer", lambda: started.append("a"))
+    b = pools.submit("qa_engineer", lambda: started.append("b"))
+    pools.submit("qa_engineer", lambda: started.append("c"))
+
+    pools.withdraw("qa_engineer", b)
+    assert pools.queue_depth("qa_engineer") == 1
+    assert pools.backlog[None] == 1
+
+    pools.release("qa_engineer")
+    pools.release("qa_engineer")
+    assert started == ["a", "c"]
+    assert pools.queue_depth() == 0
+    assert pools.pool("qa_engineer").queues == {}
+    assert pools.pool("qa_engineer").withdrawn == set()
+
+
+def test_withdrawing_every_entry_drains_the_tenant():
+    pools = RolePools({"qa_engineer": 1})
+    pools.set_weight("run", 1.0)
+    pools.submit("qa_engineer", lambda: None, tenant="run")
+    handles = [pools.submit("qa_engineer", lambda: None, tenant="run") for _ in range(5)]
+    for handle in reversed(handles):
+        pools.withdraw("qa_engineer", handle, tenant="run")
+
+    pools.remove_tenant("run")  # Nothing queued: forgotten at once
+    assert "run" not in pools.backlog and "run" not in pools.weights
+    assert pools.pool("qa_engineer").queues == {}
+
+
+def test_remove_tenant_with_queued_work_retires_it():
+    pools = RolePools({"qa_engineer": 1})
+    pools.submit("qa_engineer", lambda: None, tenant="run")
+    pools.submit("qa_engineer", lambda: None, tenant="run")
+
+    pools.remove_tenant("run")
+    assert "run" in pools.retired
+    pools.release("qa_engineer")  # Dispatches the last queued entry
+    assert "run" not in pools.retired and "run" not in pools.backlog
+
+
+def test_queue_depth_counts_only_waiting_work():
+    pools = RolePools({"qa_engineer": 2})
+    pools.submit("qa_engineer", lambda: None)
+    pools.submit("qa_engineer", lambda: None)
+    assert pools.stats()["qa_engineer"]["max_queued"] == 0
+
+    pools.submit("qa_engineer", lambda: None)
+    assert pools.stats()["qa_engineer"]["max_queued"] == 1
+
+
+def test_weighted_fair_share():
+    pools = RolePools({"backend_dev": 1})
+    pools.set_weight("heavy", 2.0)
+    pools.set_weight("light", 1.0)
+    order = []
+    for _ in range(60):
+        pools.submit("backend_dev", lambda: order.append("heavy"), tenant="heavy")
+        pools.submit("backend_dev", lambda: order.append("light"), tenant="light")
+
+    for _ in range(30):
+        pools.release("backend_dev")
+    served = order[:30]
+    assert abs(served.count("heavy") - 20) <= 1
+    assert abs(served.count("light") - 10) <= 1
+
+
+def test_idle_tenant_does_not_bank_credit():
+    pools = RolePools({"backend_dev": 1})
+    order = []
+    for _ in range(20):
+        pools.submit("backend_dev", lambda: order.append("busy"), tenant="busy")
+    for _ in range(10):
+        pools.release("backend_dev")
+
+    # A late tenant shares from now on instead of taking the next ten slots
+    for _ in range(10):
+        pools.submit("backend_dev", lambda: order.append("late"), tenant="late")
+    del order[:]
+    for _ in range(10):
+        pools.release("backend_dev")
+    assert abs(order.count("late") - 5) <= 1